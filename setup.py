@@ -36,6 +36,9 @@ setup(
         "pillow>=10.0.0",
     ],
     extras_require={
+        "jit": [
+            "numba>=0.58.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "black>=23.0.0",
@@ -0,0 +1,48 @@
+"""
+Compiled feature kernel for gesture detection
+Uses Numba when available, plain Python otherwise
+"""
+
+import math
+import numpy as np
+
+from ._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _distance(pts, a, b):
+    """Euclidean distance between two landmarks"""
+    dx = pts[a, 0] - pts[b, 0]
+    dy = pts[a, 1] - pts[b, 1]
+    dz = pts[a, 2] - pts[b, 2]
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+@njit(cache=True, fastmath=True)
+def compute_features(pts):
+    """
+    Compute per-frame gesture features from landmark points
+
+    Args:
+        pts: (21, 3) array of normalized landmark coordinates
+
+    Returns:
+        Tuple of (thumb_index_dist, thumb_middle_dist, hand_size,
+                  index_extended, middle_extended, ring_extended, pinky_extended)
+    """
+    thumb_index_dist = _distance(pts, 4, 8)
+    thumb_middle_dist = _distance(pts, 4, 12)
+    hand_size = _distance(pts, 0, 9)
+
+    # Finger is extended if tip is above PIP joint (lower y)
+    index_extended = pts[8, 1] < pts[6, 1]
+    middle_extended = pts[12, 1] < pts[10, 1]
+    ring_extended = pts[16, 1] < pts[14, 1]
+    pinky_extended = pts[20, 1] < pts[18, 1]
+
+    return (thumb_index_dist, thumb_middle_dist, hand_size,
+            index_extended, middle_extended, ring_extended, pinky_extended)
+
+
+# Compile on import so the first tracked frame doesn't stall
+compute_features(np.zeros((21, 3), dtype=np.float32))
@@ -0,0 +1,16 @@
+"""
+Optional Numba JIT support
+Provides njit, falling back to a no-op decorator when Numba is not installed
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        def decorator(func):
+            return func
+        return decorator
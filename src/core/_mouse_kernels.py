@@ -0,0 +1,47 @@
+"""
+Numeric kernels for cursor mapping and smoothing
+Uses the ahead-of-time compiled extension when it has been built,
+otherwise Numba JIT (or plain Python when Numba is not installed)
+"""
+
+from ._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _ema_step_jit(prev_x, prev_y, x, y, alpha):
+    """Single EMA update for a 2D point"""
+    return alpha * x + (1.0 - alpha) * prev_x, alpha * y + (1.0 - alpha) * prev_y
+
+
+@njit(cache=True, fastmath=True)
+def _map_point_jit(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y, offset_x, offset_y):
+    """Map a normalized point through the active area to screen pixels"""
+    screen_x = int(min(max((x - x_min) * scale_x, 0.0), max_x)) + offset_x
+    screen_y = int(min(max((y - y_min) * scale_y, 0.0), max_y)) + offset_y
+    return screen_x, screen_y
+
+
+@njit(cache=True, fastmath=True)
+def _map_and_smooth_jit(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y, offset_x, offset_y,
+                        prev_x, prev_y, alpha, has_prev):
+    """Map a normalized point to screen pixels and apply EMA smoothing in one call"""
+    screen_x, screen_y = _map_point_jit(x, y, x_min, y_min, scale_x, scale_y,
+                                        max_x, max_y, offset_x, offset_y)
+    if not has_prev:
+        return float(screen_x), float(screen_y)
+    return _ema_step_jit(prev_x, prev_y, float(screen_x), float(screen_y), alpha)
+
+
+try:
+    # Built by core._mouse_kernels_aot; no compilation at startup
+    from ._mouse_kernels_compiled import ema_step, map_point, map_and_smooth
+    HAS_AOT = True
+except ImportError:
+    HAS_AOT = False
+    ema_step = _ema_step_jit
+    map_point = _map_point_jit
+    map_and_smooth = _map_and_smooth_jit
+
+    # Compile on import so the first tracked frame doesn't stall
+    ema_step(0.0, 0.0, 0.0, 0.0, 0.5)
+    map_and_smooth(0.5, 0.5, 0.1, 0.1, 2400.0, 1350.0, 1919.0, 1079.0, 0, 0, 0.0, 0.0, 0.5, True)
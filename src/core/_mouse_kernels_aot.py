@@ -0,0 +1,39 @@
+"""
+Ahead-of-time build of the mouse kernels
+Run from the src directory with Numba installed:
+
+    python -m core._mouse_kernels_aot
+
+This writes core/_mouse_kernels_compiled.<ext>, which core._mouse_kernels
+imports in place of the JIT versions.
+"""
+
+import os
+from numba.pycc import CC
+
+from ._mouse_kernels import _ema_step_jit, _map_point_jit, _map_and_smooth_jit
+
+cc = CC('_mouse_kernels_compiled')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('ema_step', 'UniTuple(f8, 2)(f8, f8, f8, f8, f8)')
+def ema_step(prev_x, prev_y, x, y, alpha):
+    return _ema_step_jit(prev_x, prev_y, x, y, alpha)
+
+
+@cc.export('map_point', 'UniTuple(i8, 2)(f8, f8, f8, f8, f8, f8, f8, f8, i8, i8)')
+def map_point(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y, offset_x, offset_y):
+    return _map_point_jit(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y, offset_x, offset_y)
+
+
+@cc.export('map_and_smooth',
+           'UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8, f8, f8, i8, i8, f8, f8, f8, b1)')
+def map_and_smooth(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y, offset_x, offset_y,
+                   prev_x, prev_y, alpha, has_prev):
+    return _map_and_smooth_jit(x, y, x_min, y_min, scale_x, scale_y, max_x, max_y,
+                               offset_x, offset_y, prev_x, prev_y, alpha, has_prev)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,215 @@
+"""
+Native mouse backends
+Bind the platform cursor API once so hot-path calls skip PyAutoGUI's wrappers
+"""
+
+import sys
+import logging
+from typing import Tuple
+import pyautogui
+
+logger = logging.getLogger(__name__)
+
+
+class PyAutoGUIBackend:
+    """Fallback backend using PyAutoGUI"""
+
+    name = "pyautogui"
+    # PyAutoGUI works in points on macOS and in physical pixels elsewhere
+    physical_pixels = sys.platform != "darwin"
+
+    def position(self) -> Tuple[int, int]:
+        return pyautogui.position()
+
+    def move_to(self, x: int, y: int):
+        pyautogui.moveTo(x, y, duration=0)
+
+    def mouse_down(self, button: str):
+        pyautogui.mouseDown(button=button)
+
+    def mouse_up(self, button: str):
+        pyautogui.mouseUp(button=button)
+
+    def click(self, button: str):
+        pyautogui.click(button=button)
+
+    def scroll(self, clicks: int):
+        pyautogui.scroll(clicks)
+
+
+class Win32Backend:
+    """Windows backend using user32 directly"""
+
+    name = "win32"
+    physical_pixels = True
+
+    # mouse_event flags: (down, up) per button
+    _BUTTON_FLAGS = {
+        "left": (0x0002, 0x0004),
+        "right": (0x0008, 0x0010),
+        "middle": (0x0020, 0x0040),
+    }
+    _WHEEL = 0x0800
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+        self._ctypes = ctypes
+        self._user32 = ctypes.windll.user32
+        self._point = wintypes.POINT()
+        self.move_to = self._user32.SetCursorPos
+        self._mouse_event = self._user32.mouse_event
+
+    def position(self) -> Tuple[int, int]:
+        self._user32.GetCursorPos(self._ctypes.byref(self._point))
+        return self._point.x, self._point.y
+
+    def mouse_down(self, button: str):
+        self._mouse_event(self._BUTTON_FLAGS[button][0], 0, 0, 0, 0)
+
+    def mouse_up(self, button: str):
+        self._mouse_event(self._BUTTON_FLAGS[button][1], 0, 0, 0, 0)
+
+    def click(self, button: str):
+        down, up = self._BUTTON_FLAGS[button]
+        self._mouse_event(down, 0, 0, 0, 0)
+        self._mouse_event(up, 0, 0, 0, 0)
+
+    def scroll(self, clicks: int):
+        self._mouse_event(self._WHEEL, 0, 0, clicks, 0)
+
+
+class X11Backend:
+    """Linux/X11 backend using python-xlib's XTEST extension"""
+
+    name = "x11"
+    physical_pixels = True
+
+    _BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    _SCROLL_UP = 4
+    _SCROLL_DOWN = 5
+
+    def __init__(self):
+        from Xlib import X
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+        self._X = X
+        self._xtest = xtest
+        self._display = Display()
+        self._root = self._display.screen().root
+
+    def position(self) -> Tuple[int, int]:
+        reply = self._root.query_pointer()
+        return reply.root_x, reply.root_y
+
+    def move_to(self, x: int, y: int):
+        self._xtest.fake_input(self._display, self._X.MotionNotify, x=x, y=y)
+        self._display.sync()
+
+    def _press(self, button: int):
+        self._xtest.fake_input(self._display, self._X.ButtonPress, button)
+
+    def _release(self, button: int):
+        self._xtest.fake_input(self._display, self._X.ButtonRelease, button)
+
+    def mouse_down(self, button: str):
+        self._press(self._BUTTONS[button])
+        self._display.sync()
+
+    def mouse_up(self, button: str):
+        self._release(self._BUTTONS[button])
+        self._display.sync()
+
+    def click(self, button: str):
+        self._press(self._BUTTONS[button])
+        self._release(self._BUTTONS[button])
+        self._display.sync()
+
+    def scroll(self, clicks: int):
+        # X11 scrolls with one button press per click (4 = up, 5 = down)
+        button = self._SCROLL_UP if clicks > 0 else self._SCROLL_DOWN
+        for _ in range(abs(clicks)):
+            self._press(button)
+            self._release(button)
+        self._display.sync()
+
+
+class QuartzBackend:
+    """macOS backend using Quartz event services"""
+
+    name = "quartz"
+    # Quartz event coordinates are in points
+    physical_pixels = False
+
+    def __init__(self):
+        import Quartz as Q
+        self._Q = Q
+        # (down event, up event, drag event, button) per button
+        self._events = {
+            "left": (Q.kCGEventLeftMouseDown, Q.kCGEventLeftMouseUp,
+                     Q.kCGEventLeftMouseDragged, Q.kCGMouseButtonLeft),
+            "right": (Q.kCGEventRightMouseDown, Q.kCGEventRightMouseUp,
+                      Q.kCGEventRightMouseDragged, Q.kCGMouseButtonRight),
+            "middle": (Q.kCGEventOtherMouseDown, Q.kCGEventOtherMouseUp,
+                       Q.kCGEventOtherMouseDragged, Q.kCGMouseButtonCenter),
+        }
+        self._held = None
+
+    def _post(self, event_type, position, button):
+        Q = self._Q
+        event = Q.CGEventCreateMouseEvent(None, event_type, position, button)
+        Q.CGEventPost(Q.kCGHIDEventTap, event)
+
+    def position(self) -> Tuple[int, int]:
+        location = self._Q.CGEventGetLocation(self._Q.CGEventCreate(None))
+        return int(location.x), int(location.y)
+
+    def move_to(self, x: int, y: int):
+        # Moves while a button is held must be drag events for apps to see a drag
+        if self._held is not None:
+            _, _, drag, button = self._events[self._held]
+            self._post(drag, (x, y), button)
+        else:
+            self._post(self._Q.kCGEventMouseMoved, (x, y), self._Q.kCGMouseButtonLeft)
+
+    def mouse_down(self, button: str):
+        down, _, _, btn = self._events[button]
+        self._post(down, self.position(), btn)
+        self._held = button
+
+    def mouse_up(self, button: str):
+        _, up, _, btn = self._events[button]
+        self._post(up, self.position(), btn)
+        self._held = None
+
+    def click(self, button: str):
+        down, up, _, btn = self._events[button]
+        position = self.position()
+        self._post(down, position, btn)
+        self._post(up, position, btn)
+
+    def scroll(self, clicks: int):
+        Q = self._Q
+        event = Q.CGEventCreateScrollWheelEvent(None, Q.kCGScrollEventUnitLine, 1, clicks)
+        Q.CGEventPost(Q.kCGHIDEventTap, event)
+
+
+def create_backend():
+    """
+    Create the mouse backend for the current platform
+
+    Returns:
+        Native backend if available, otherwise the PyAutoGUI backend
+    """
+    try:
+        if sys.platform == "win32":
+            backend = Win32Backend()
+        elif sys.platform == "darwin":
+            backend = QuartzBackend()
+        else:
+            backend = X11Backend()
+        logger.info(f"Using native mouse backend: {backend.name}")
+        return backend
+    except Exception as e:
+        logger.warning(f"Native mouse backend unavailable, using PyAutoGUI: {e}")
+        return PyAutoGUIBackend()
@@ -5,14 +5,26 @@ Handles webcam initialization, frame capture, and preprocessing
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 import logging
-
+import threading
 import time
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Result of the last camera probe, shared across CameraManager instances
+_available_cameras: Optional[list] = None
+
+
+def _probe_camera(index: int) -> bool:
+    """Check whether a camera index can be opened"""
+    cap = cv2.VideoCapture(index)
+    try:
+        return cap.isOpened()
+    finally:
+        cap.release()
+
 
 class CameraManager:
     """Manages webcam connection and frame capture"""
@@ -37,6 +49,18 @@ class CameraManager:
         self.last_reconnect_time = 0
         self.reconnect_interval = 2.0  # seconds
         
+        # Background capture: a reader thread keeps only the latest frame
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._reader_thread: Optional[threading.Thread] = None
+        self._latest: Optional[np.ndarray] = None
+        self._frame_id = 0
+        
+        # Reused mirrored frames: handed to the consumer and only recycled once it
+        # has read the next one (each reader keeps its own decode buffer)
+        self._spare: list = []
+        self._consumer_frame: Optional[np.ndarray] = None
+        
     def start(self) -> bool:
         """
         Start camera capture
@@ -45,7 +69,7 @@ class CameraManager:
             True if camera started successfully, False otherwise
         """
         try:
-            if self.cap is not None:
+            if not self._stop_reader() and self.cap is not None:
                 self.cap.release()
                 
             self.cap = cv2.VideoCapture(self.camera_index)
@@ -54,13 +78,33 @@ class CameraManager:
                 logger.error(f"Failed to open camera {self.camera_index}")
                 return False
             
+            # Request MJPEG before resolution/FPS; many webcams cap raw YUY2 at low FPS
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            
             # Set camera properties
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
+            # Keep the driver queue short so we always get a fresh frame
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+            fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+            fourcc_str = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+            logger.info(f"Camera pixel format: {fourcc_str}")
             
             self.is_active = True
             self.is_reconnecting = False
+            
+            # Start background frame reader; each reader gets its own stop event, so
+            # one that outlived its stop timeout can't be revived by this start
+            self._latest = None
+            self._consumer_frame = None
+            self._stop_event = threading.Event()
+            self._reader_thread = threading.Thread(
+                target=self._reader, args=(self.cap, self._stop_event),
+                name="CameraReader", daemon=True
+            )
+            self._reader_thread.start()
             logger.info(f"Camera {self.camera_index} started successfully")
             return True
             
@@ -77,64 +121,153 @@ class CameraManager:
             - success: True if frame was read successfully
             - frame: The captured frame as numpy array (BGR format)
         """
+        _, frame = self.read_frame_with_id()
+        return frame is not None, frame
+    
+    def read_frame_with_id(self) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Read the latest frame together with its sequence number
+        
+        The same frame is returned again (with the same id) until the camera
+        delivers a new one, so callers can skip work on unchanged frames.
+        
+        The frame belongs to the caller until its next call: it may be drawn on,
+        and the reader thread never writes to it. After that it is recycled, so
+        only a single consumer is supported.
+        
+        Returns:
+            Tuple of (frame_id, frame)
+            - frame_id: Increasing counter of frames captured
+            - frame: The captured frame as numpy array (BGR format), or None
+        """
         if self.is_reconnecting:
-            current_time = time.time()
+            current_time = time.perf_counter()
             if current_time - self.last_reconnect_time >= self.reconnect_interval:
                 logger.info(f"Attempting to reconnect camera {self.camera_index}...")
                 self.last_reconnect_time = current_time
                 if self.start():
                     logger.info("Camera reconnected!")
                 else:
-                    return False, None
+                    return self._frame_id, None
             else:
-                return False, None
+                return self._frame_id, None
 
         if not self.is_active or self.cap is None:
-            return False, None
+            return self._frame_id, None
         
+        with self._lock:
+            if self._latest is not None:
+                # Take ownership of the new frame and recycle the one handed out before
+                if self._consumer_frame is not None:
+                    self._spare.append(self._consumer_frame)
+                self._consumer_frame = self._latest
+                self._latest = None
+            return self._frame_id, self._consumer_frame
+    
+    def _reader(self, cap: cv2.VideoCapture, stop_event: threading.Event):
+        """
+        Grab frames in the background, keeping only the most recent one
+        
+        The reader releases the capture itself when it exits, so it is never
+        released by another thread while a grab is in progress.
+        
+        Args:
+            cap: Opened capture to read from
+            stop_event: Set to make this reader exit
+        """
+        raw_buf = None
         try:
-            ret, frame = self.cap.read()
-            
-            if not ret or frame is None:
-                logger.warning("Failed to read frame from camera. Entering reconnect mode.")
-                self.is_reconnecting = True
-                self.is_active = False
-                self.last_reconnect_time = time.time()
-                return False, None
-            
-            # Flip frame horizontally for mirror effect (more intuitive for users)
-            frame = cv2.flip(frame, 1)
-            
-            return True, frame
-            
-        except Exception as e:
-            logger.error(f"Error reading frame: {e}")
-            self.is_reconnecting = True
-            self.is_active = False
-            self.last_reconnect_time = time.time()
-            return False, None
+            while not stop_event.is_set():
+                try:
+                    # Split grab/retrieve so frames are only decoded when grabbed successfully
+                    if not cap.grab():
+                        logger.warning("Failed to read frame from camera. Entering reconnect mode.")
+                        self._enter_reconnect()
+                        return
+                    
+                    ret, raw = cap.retrieve(raw_buf)
+                    if not ret or raw is None:
+                        continue
+                    raw_buf = raw
+                    
+                    # Flip frame horizontally for mirror effect (more intuitive for users)
+                    # into a free buffer; the result is contiguous so it can be drawn on
+                    with self._lock:
+                        frame = self._spare.pop() if self._spare else None
+                    if frame is None or frame.shape != raw.shape:
+                        frame = np.empty_like(raw)
+                    cv2.flip(raw, 1, dst=frame)
+                    
+                    with self._lock:
+                        if stop_event.is_set():
+                            # Stopped while capturing; don't publish a frame from this capture
+                            return
+                        if self._latest is not None:
+                            # Never picked up by the consumer, so it is free again
+                            self._spare.append(self._latest)
+                        self._latest = frame
+                        self._frame_id += 1
+                        
+                except Exception as e:
+                    logger.error(f"Error reading frame: {e}")
+                    self._enter_reconnect()
+                    return
+        finally:
+            cap.release()
+    
+    def _enter_reconnect(self):
+        """Mark the camera as lost so read_frame() attempts to reconnect"""
+        self.is_reconnecting = True
+        self.is_active = False
+        self.last_reconnect_time = time.perf_counter()
+    
+    def _stop_reader(self) -> bool:
+        """
+        Stop the background reader thread
+        
+        Returns:
+            True if a reader was started; it releases the capture itself on exit,
+            so the caller must not release it
+        """
+        self._stop_event.set()
+        thread = self._reader_thread
+        if thread is None:
+            return False
+        self._reader_thread = None
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+            if thread.is_alive():
+                logger.warning("Camera reader did not stop in time; "
+                               "it will release the capture when it exits")
+        return True
     
     def stop(self):
         """Stop camera capture and release resources"""
-        if self.cap is not None:
+        if not self._stop_reader() and self.cap is not None:
             self.cap.release()
+        if self.cap is not None:
             self.is_active = False
             logger.info("Camera stopped")
     
-    def get_available_cameras(self) -> list:
+    def get_available_cameras(self, rescan: bool = False) -> list:
         """
         Get list of available camera indices
         
+        Cameras are probed in parallel on first use and the result is cached.
+        
+        Args:
+            rescan: Probe the cameras again instead of using the cached result
+        
         Returns:
             List of available camera indices
         """
-        available = []
-        for i in range(5):  # Check first 5 camera indices
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                available.append(i)
-                cap.release()
-        return available
+        global _available_cameras
+        if _available_cameras is None or rescan:
+            # Check first 5 camera indices concurrently (opening a device is slow)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results = list(executor.map(_probe_camera, range(5)))
+            _available_cameras = [i for i, ok in enumerate(results) if ok]
+        return list(_available_cameras)
     
     def get_frame_size(self) -> Tuple[int, int]:
         """
@@ -4,13 +4,12 @@ Analyzes hand landmarks to detect specific gestures
 """
 
 import time
-import numpy as np
 from typing import Optional, Tuple
 from enum import Enum
 import logging
 from .hand_tracker import HandLandmarks
+from ._gesture_kernel import compute_features
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +36,7 @@ class GestureState:
             debounce_time: Minimum time between gesture triggers (seconds)
         """
         self.current_gesture = GestureType.NONE
-        self.last_trigger_time = 0
+        self.last_trigger_time = float('-inf')
         self.debounce_time = debounce_time
         self.is_pinched = False
         self.is_middle_pinched = False
@@ -46,13 +45,15 @@ class GestureState:
         self.thumb_middle_pinch_start = 0
         self.scroll_baseline = None
         
-    def can_trigger(self) -> bool:
+    def can_trigger(self, now: Optional[float] = None) -> bool:
         """Check if enough time has passed to trigger a new gesture"""
-        return (time.time() - self.last_trigger_time) >= self.debounce_time
+        if now is None:
+            now = time.monotonic()
+        return (now - self.last_trigger_time) >= self.debounce_time
     
-    def trigger(self):
+    def trigger(self, now: Optional[float] = None):
         """Mark that a gesture was triggered"""
-        self.last_trigger_time = time.time()
+        self.last_trigger_time = time.monotonic() if now is None else now
 
 
 class GestureDetector:
@@ -83,12 +84,14 @@ class GestureDetector:
         
         logger.info("Gesture detector initialized")
     
-    def detect_gesture(self, hand: Optional[HandLandmarks]) -> Tuple[GestureType, dict]:
+    def detect_gesture(self, hand: Optional[HandLandmarks],
+                       now: Optional[float] = None) -> Tuple[GestureType, dict]:
         """
         Detect gesture from hand landmarks
         
         Args:
             hand: HandLandmarks object
+            now: Frame timestamp from time.monotonic() (taken here if omitted)
             
         Returns:
             Tuple of (gesture_type, gesture_data)
@@ -111,41 +114,37 @@ class GestureDetector:
             self.prev_scroll_pos = None
             return GestureType.NONE, {}
         
-        # Get key landmark positions
-        thumb_tip = hand.get_landmark(HandLandmarks.THUMB_TIP)
-        index_tip = hand.get_landmark(HandLandmarks.INDEX_FINGER_TIP)
-        middle_tip = hand.get_landmark(HandLandmarks.MIDDLE_FINGER_TIP)
+        # Single timestamp for the whole frame
+        if now is None:
+            now = time.monotonic()
         
-        # Calculate distances
-        thumb_index_dist = hand.get_distance(HandLandmarks.THUMB_TIP, 
-                                             HandLandmarks.INDEX_FINGER_TIP)
-        thumb_middle_dist = hand.get_distance(HandLandmarks.THUMB_TIP,
-                                               HandLandmarks.MIDDLE_FINGER_TIP)
+        # Get key landmark positions
+        pts = hand.points
+        index_tip = pts[HandLandmarks.INDEX_FINGER_TIP]
+        middle_tip = pts[HandLandmarks.MIDDLE_FINGER_TIP]
         
-        # Normalize distances by hand size (wrist to middle finger MCP)
-        hand_size = hand.get_distance(HandLandmarks.WRIST, 
-                                      HandLandmarks.MIDDLE_FINGER_MCP)
-        thumb_index_dist_norm = thumb_index_dist / hand_size if hand_size > 0 else 1.0
-        thumb_middle_dist_norm = thumb_middle_dist / hand_size if hand_size > 0 else 1.0
+        # Calculate distances and finger extension in one compiled call
+        (thumb_index_dist, thumb_middle_dist, hand_size,
+         index_extended, middle_extended, ring_extended, pinky_extended) = compute_features(pts)
         
-        # Check for pinch gestures
-        is_thumb_index_pinched = thumb_index_dist_norm < self.pinch_threshold
-        is_thumb_middle_pinched = thumb_middle_dist_norm < self.pinch_threshold
+        # Pinch threshold scaled by hand size (wrist to middle finger MCP),
+        # equivalent to comparing normalized distances without dividing
+        pinch_limit = self.pinch_threshold * hand_size
         
         # --- Left Click & Drag Logic ---
-        if is_thumb_index_pinched:
+        if thumb_index_dist < pinch_limit:
             if not self.state.is_pinched:
                 self.state.is_pinched = True
-                self.state.thumb_index_pinch_start = time.time()
+                self.state.thumb_index_pinch_start = now
             
             # Transition to drag if held long enough
-            if not self.state.is_dragging and (time.time() - self.state.thumb_index_pinch_start > self.drag_threshold):
+            if not self.state.is_dragging and (now - self.state.thumb_index_pinch_start > self.drag_threshold):
                 self.state.is_dragging = True
                 logger.debug("Drag started")
-                return GestureType.DRAG_START, {"position": index_tip[:2]}
+                return GestureType.DRAG_START, {"position": (float(index_tip[0]), float(index_tip[1]))}
                 
             if self.state.is_dragging:
-                return GestureType.DRAG, {"position": index_tip[:2]}
+                return GestureType.DRAG, {"position": (float(index_tip[0]), float(index_tip[1]))}
         else:
             if self.state.is_pinched:
                 # If was dragging, trigger stop
@@ -153,44 +152,39 @@ class GestureDetector:
                     self.state.is_dragging = False
                     self.state.is_pinched = False
                     logger.debug("Drag stopped")
-                    return GestureType.DRAG_STOP, {"position": index_tip[:2]}
+                    return GestureType.DRAG_STOP, {"position": (float(index_tip[0]), float(index_tip[1]))}
                 
                 # If released quickly, it's a click
-                if (time.time() - self.state.thumb_index_pinch_start < self.drag_threshold):
-                    if self.state.can_trigger():
+                if (now - self.state.thumb_index_pinch_start < self.drag_threshold):
+                    if self.state.can_trigger(now):
                         self.state.is_pinched = False
-                        self.state.trigger()
+                        self.state.trigger(now)
                         logger.debug("Left click detected")
-                        return GestureType.LEFT_CLICK, {"position": index_tip[:2]}
+                        return GestureType.LEFT_CLICK, {"position": (float(index_tip[0]), float(index_tip[1]))}
                 
                 self.state.is_pinched = False
 
         # --- Right Click Logic ---
-        if is_thumb_middle_pinched:
+        # Only reached when the left click/drag logic didn't return
+        if thumb_middle_dist < pinch_limit:
             if not self.state.is_middle_pinched:
                 self.state.is_middle_pinched = True
-                self.state.thumb_middle_pinch_start = time.time()
+                self.state.thumb_middle_pinch_start = now
             
-            if self.state.can_trigger():
-                self.state.trigger()
+            if self.state.can_trigger(now):
+                self.state.trigger(now)
                 logger.debug("Right click detected")
-                return GestureType.RIGHT_CLICK, {"position": middle_tip[:2]}
+                return GestureType.RIGHT_CLICK, {"position": (float(middle_tip[0]), float(middle_tip[1]))}
         else:
             self.state.is_middle_pinched = False
             self.state.thumb_middle_pinch_start = 0
         
-        # Check if index and middle fingers are extended (scroll mode)
-        index_extended = self._is_finger_extended(hand, HandLandmarks.INDEX_FINGER_TIP)
-        middle_extended = self._is_finger_extended(hand, HandLandmarks.MIDDLE_FINGER_TIP)
-        ring_extended = self._is_finger_extended(hand, HandLandmarks.RING_FINGER_TIP)
-        pinky_extended = self._is_finger_extended(hand, HandLandmarks.PINKY_TIP)
-        
         # Scroll mode: index and middle extended, ring and pinky closed
         if index_extended and middle_extended and not ring_extended and not pinky_extended:
             # Calculate midpoint between index and middle finger
             scroll_pos = (
-                (index_tip[0] + middle_tip[0]) / 2,
-                (index_tip[1] + middle_tip[1]) / 2
+                float(index_tip[0] + middle_tip[0]) / 2,
+                float(index_tip[1] + middle_tip[1]) / 2
             )
             
             if self.prev_scroll_pos is not None:
@@ -198,7 +192,7 @@ class GestureDetector:
                 
                 if abs(delta_y) > self.scroll_threshold:
                     self.prev_scroll_pos = scroll_pos
-                    logger.debug(f"Scroll detected: delta_y={delta_y}")
+                    logger.debug("Scroll detected: delta_y=%s", delta_y)
                     return GestureType.SCROLL, {"delta_y": delta_y, "position": scroll_pos}
             
             self.prev_scroll_pos = scroll_pos
@@ -208,46 +202,27 @@ class GestureDetector:
         
         # Default: Cursor control with index finger
         if index_extended:
-            position = index_tip[:2]
+            position = (float(index_tip[0]), float(index_tip[1]))
             
-            # Calculate velocity (for motion detection)
-            velocity = 0
+            # Squared velocity (for motion detection); compare against
+            # squared thresholds, or use math.sqrt if the magnitude is needed
+            velocity_sq = 0.0
             if self.prev_index_pos is not None:
                 dx = position[0] - self.prev_index_pos[0]
                 dy = position[1] - self.prev_index_pos[1]
-                velocity = np.sqrt(dx**2 + dy**2)
+                velocity_sq = dx * dx + dy * dy
             
             self.prev_index_pos = position
             
             return GestureType.CURSOR_MOVE, {
                 "position": position,
-                "velocity": velocity
+                "velocity_sq": velocity_sq
             }
         
         # No recognized gesture
         self.prev_index_pos = None
         return GestureType.NONE, {}
     
-    def _is_finger_extended(self, hand: HandLandmarks, finger_tip_idx: int) -> bool:
-        """
-        Check if a finger is extended
-        
-        Args:
-            hand: HandLandmarks object
-            finger_tip_idx: Index of the finger tip
-            
-        Returns:
-            True if finger is extended
-        """
-        # Get corresponding PIP joint (2 indices before tip)
-        pip_idx = finger_tip_idx - 2
-        
-        tip_y = hand.get_landmark(finger_tip_idx)[1]
-        pip_y = hand.get_landmark(pip_idx)[1]
-        
-        # Finger is extended if tip is above PIP joint
-        return tip_y < pip_y
-    
     def reset(self):
         """Reset gesture detector state"""
         self.state = GestureState(debounce_time=self.state.debounce_time)
@@ -7,15 +7,80 @@ Detects hands and extracts 21 landmark points per hand
 import mediapipe as mp
 
 import cv2
+import math
+import os
+import time
+import urllib.request
 import numpy as np
-from typing import Optional, List, Tuple
+from typing import Optional, Tuple
 import logging
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Hand skeleton as open polylines (thumb, index, middle, ring, pinky, palm)
+_HAND_POLYLINES = [
+    np.array([0, 1, 2, 3, 4]),
+    np.array([0, 5, 6, 7, 8]),
+    np.array([0, 9, 10, 11, 12]),
+    np.array([0, 13, 14, 15, 16]),
+    np.array([0, 17, 18, 19, 20]),
+    np.array([5, 9, 13, 17]),
+]
+
+# Frame size fed to MediaPipe (320x240 is enough for hand landmarks)
+ENGINE_WIDTH = 320
+ENGINE_HEIGHT = 240
+
+# Hand landmarker model bundles by precision
+MODEL_URL = ("https://storage.googleapis.com/mediapipe-models/"
+             "hand_landmarker/hand_landmarker/{precision}/1/hand_landmarker.task")
+MODEL_PATHS = {
+    "float16": "hand_landmarker.task",
+    "int8": "hand_landmarker_int8.task",
+}
+
+# Optional models that failed to download in this process (retried on the next run)
+_unavailable_models = set()
+
+
+def _ensure_model(precision: str, optional: bool = False) -> Optional[str]:
+    """
+    Download the hand landmarker model if needed
+    
+    Args:
+        precision: Model precision ("float16" or "int8")
+        optional: A fallback exists; on failure log a warning, remember it and
+                  return None instead of raising
+        
+    Returns:
+        Path to the local model file, or None if an optional model is unavailable
+    """
+    model_path = MODEL_PATHS[precision]
+    if os.path.exists(model_path):
+        return model_path
+    
+    if optional and precision in _unavailable_models:
+        return None
+    
+    logger.info(f"Downloading {precision} hand landmarker model...")
+    try:
+        urllib.request.urlretrieve(MODEL_URL.format(precision=precision), model_path)
+        logger.info("Model downloaded successfully")
+        return model_path
+    except Exception as e:
+        if os.path.exists(model_path):
+            os.remove(model_path)
+        if not optional:
+            logger.error(f"Failed to download model: {e}")
+            raise
+        
+        logger.warning(f"{precision} hand landmarker model unavailable ({e}); "
+                       "not retrying until the next run")
+        _unavailable_models.add(precision)
+        return None
+
 
 class HandLandmarks:
     """Container for hand landmark data"""
@@ -43,6 +108,10 @@ class HandLandmarks:
     PINKY_DIP = 19
     PINKY_TIP = 20
     
+    # Tip and PIP joint indices for index, middle, ring and pinky fingers
+    FINGER_TIPS = np.array([INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP])
+    FINGER_PIPS = np.array([INDEX_FINGER_PIP, MIDDLE_FINGER_PIP, RING_FINGER_PIP, PINKY_PIP])
+    
     def __init__(self, landmarks, handedness: str):
         """
         Initialize hand landmarks
@@ -53,13 +122,15 @@ class HandLandmarks:
         """
         self.landmarks = landmarks
         self.handedness = handedness
-        self.points = []
         
-        # Extract landmark points as (x, y, z) tuples
-        for lm in landmarks.landmark:
-            self.points.append((lm.x, lm.y, lm.z))
+        # Extract landmark points once into a contiguous (21, 3) array
+        self.points = np.fromiter(
+            (c for lm in landmarks.landmark for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=len(landmarks.landmark) * 3
+        ).reshape(-1, 3)
     
-    def get_landmark(self, index: int) -> Tuple[float, float, float]:
+    def get_landmark(self, index: int) -> np.ndarray:
         """
         Get specific landmark point
         
@@ -67,11 +138,25 @@ class HandLandmarks:
             index: Landmark index (0-20)
             
         Returns:
-            Tuple of (x, y, z) coordinates (normalized 0-1)
+            Array of (x, y, z) coordinates (normalized 0-1)
         """
         if 0 <= index < len(self.points):
             return self.points[index]
-        return (0.0, 0.0, 0.0)
+        return np.zeros(3, dtype=np.float32)
+    
+    def get_landmark_unchecked(self, index: int) -> np.ndarray:
+        """
+        Get specific landmark point without bounds checking
+        
+        Use on hot paths with known-valid indices (the class constants).
+        
+        Args:
+            index: Landmark index (0-20)
+            
+        Returns:
+            Array of (x, y, z) coordinates (normalized 0-1)
+        """
+        return self.points[index]
     
     def get_distance(self, index1: int, index2: int) -> float:
         """
@@ -84,9 +169,21 @@ class HandLandmarks:
         Returns:
             Distance between the two landmarks
         """
-        p1 = np.array(self.get_landmark(index1))
-        p2 = np.array(self.get_landmark(index2))
-        return np.linalg.norm(p1 - p2)
+        p1 = self.points[index1]
+        p2 = self.points[index2]
+        dx = p1[0] - p2[0]
+        dy = p1[1] - p2[1]
+        dz = p1[2] - p2[2]
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+    
+    def fingers_extended(self) -> np.ndarray:
+        """
+        Check which fingers are extended (tip above PIP joint)
+        
+        Returns:
+            Boolean array for index, middle, ring and pinky fingers
+        """
+        return self.points[self.FINGER_TIPS, 1] < self.points[self.FINGER_PIPS, 1]
 
 
 class HandDetector:
@@ -95,7 +192,9 @@ class HandDetector:
     def __init__(self, 
                  max_hands: int = 1,
                  detection_confidence: float = 0.7,
-                 tracking_confidence: float = 0.5):
+                 tracking_confidence: float = 0.5,
+                 use_gpu: bool = True,
+                 draw: bool = True):
         """
         Initialize hand detector
         
@@ -103,71 +202,81 @@ class HandDetector:
             max_hands: Maximum number of hands to detect
             detection_confidence: Minimum confidence for hand detection
             tracking_confidence: Minimum confidence for hand tracking
+            use_gpu: Run inference on the GPU delegate (falls back to CPU if unavailable)
+            draw: Draw landmarks on the annotated frame
         """
         self.max_hands = max_hands
+        self.draw = draw
         self.detection_confidence = detection_confidence
         self.tracking_confidence = tracking_confidence
         
-        # Download model if needed
-        import urllib.request
-        import os
-        
-        model_path = "hand_landmarker.task"
-        if not os.path.exists(model_path):
-            logger.info("Downloading hand landmarker model...")
-            model_url = "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task"
+        # Create the hand landmarker, preferring the GPU delegate (float16 model)
+        self.detector = None
+        if use_gpu:
             try:
-                urllib.request.urlretrieve(model_url, model_path)
-                logger.info("Model downloaded successfully")
+                model_path = _ensure_model("float16")
+                self.detector = self._create_detector(model_path, python.BaseOptions.Delegate.GPU)
+                logger.info("Hand detector using GPU delegate")
             except Exception as e:
-                logger.error(f"Failed to download model: {e}")
-                raise
+                logger.warning(f"GPU delegate unavailable, falling back to CPU: {e}")
         
-        # Create hand landmarker options
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        options = vision.HandLandmarkerOptions(
-            base_options=base_options,
-            running_mode=vision.RunningMode.VIDEO,
-            num_hands=max_hands,
-            min_hand_detection_confidence=detection_confidence,
-            min_hand_presence_confidence=tracking_confidence,
-            min_tracking_confidence=tracking_confidence
-        )
+        # CPU inference prefers the int8 quantized model (faster with XNNPACK)
+        if self.detector is None:
+            model_path = _ensure_model("int8", optional=True) or _ensure_model("float16")
+            self.detector = self._create_detector(model_path, python.BaseOptions.Delegate.CPU)
         
-        # Create the hand landmarker
-        self.detector = vision.HandLandmarker.create_from_options(options)
         self.frame_timestamp_ms = 0
         
+        # Reusable buffers for the downscaled BGR and RGB engine frames
+        self._small_buf = np.empty((ENGINE_HEIGHT, ENGINE_WIDTH, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty((ENGINE_HEIGHT, ENGINE_WIDTH, 3), dtype=np.uint8)
+        
         logger.info("Hand detector initialized")
     
-    def detect(self, frame: np.ndarray) -> Tuple[Optional[HandLandmarks], np.ndarray]:
+    def _create_detector(self, model_path: str, delegate):
+        """Create a MediaPipe hand landmarker on the given delegate"""
+        base_options = python.BaseOptions(model_asset_path=model_path, delegate=delegate)
+        options = vision.HandLandmarkerOptions(
+            base_options=base_options,
+            running_mode=vision.RunningMode.VIDEO,
+            num_hands=self.max_hands,
+            min_hand_detection_confidence=self.detection_confidence,
+            min_hand_presence_confidence=self.tracking_confidence,
+            min_tracking_confidence=self.tracking_confidence
+        )
+        return vision.HandLandmarker.create_from_options(options)
+    
+    def detect(self, frame: np.ndarray,
+               draw: Optional[bool] = None) -> Tuple[Optional[HandLandmarks], np.ndarray]:
         """
         Detect hands in a frame with resolution optimization
         
         Args:
             frame: Input frame (BGR format, typically 640x480)
+            draw: Draw landmarks on the annotated frame (defaults to self.draw).
+                  Landmarks are drawn in place, so the annotated frame is the input frame.
             
         Returns:
             Tuple of (hand_landmarks, annotated_frame)
         """
         # OPTIMIZATION: Downscale frame for MediaPipe processing (320x240 is enough)
         # Full frame used for display, smaller frame used for engine
-        h, w = frame.shape[:2]
-        engine_w, engine_h = 320, 240
-        small_frame = cv2.resize(frame, (engine_w, engine_h))
+        # Both steps write into preallocated buffers (no per-frame allocation)
+        cv2.resize(frame, (ENGINE_WIDTH, ENGINE_HEIGHT), dst=self._small_buf)
         
         # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+        cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
         # Create MediaPipe Image
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
         
-        # Detect hand landmarks
-        self.frame_timestamp_ms += 33  # Approximately 30 FPS
+        # Detect hand landmarks using real (monotonic, strictly increasing) timestamps
+        timestamp_ms = int(time.monotonic() * 1000)
+        self.frame_timestamp_ms = max(timestamp_ms, self.frame_timestamp_ms + 1)
         results = self.detector.detect_for_video(mp_image, self.frame_timestamp_ms)
         
-        # Create annotated frame (on original resolution)
-        annotated_frame = frame.copy()
+        # Landmarks are drawn in place, so no annotated copy is made
+        annotated_frame = frame
         
         hand_landmarks = None
         
@@ -180,8 +289,9 @@ class HandDetector:
             # Convert to our HandLandmarks format
             hand_landmarks = self._create_hand_landmarks(landmarks, handedness)
             
-            # Draw hand landmarks on frame
-            self._draw_landmarks(annotated_frame, landmarks)
+            # Draw hand landmarks (original resolution)
+            if self.draw if draw is None else draw:
+                self._draw_landmarks(annotated_frame, landmarks)
         
         return hand_landmarks, annotated_frame
     
@@ -199,30 +309,16 @@ class HandDetector:
         height, width, _ = image.shape
         
         # Convert normalized coordinates to pixel coordinates
-        landmark_points = []
-        for landmark in hand_landmarks:
-            x = int(landmark.x * width)
-            y = int(landmark.y * height)
-            landmark_points.append((x, y))
-        
-        # Draw connections
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),  # Index
-            (0, 9), (9, 10), (10, 11), (11, 12),  # Middle
-            (0, 13), (13, 14), (14, 15), (15, 16),  # Ring
-            (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-            (5, 9), (9, 13), (13, 17)  # Palm
-        ]
-        
-        for connection in connections:
-            start_point = landmark_points[connection[0]]
-            end_point = landmark_points[connection[1]]
-            cv2.line(image, start_point, end_point, (0, 255, 0), 2)
+        landmark_points = (
+            np.array([(lm.x, lm.y) for lm in hand_landmarks], dtype=np.float32) * (width, height)
+        ).astype(np.int32)
+        
+        # Draw all connections in a single call
+        cv2.polylines(image, [landmark_points[idx] for idx in _HAND_POLYLINES], False, (0, 255, 0), 2)
         
         # Draw landmarks
-        for point in landmark_points:
-            cv2.circle(image, point, 5, (0, 0, 255), -1)
+        for x, y in landmark_points:
+            cv2.circle(image, (int(x), int(y)), 5, (0, 0, 255), -1)
     
     def is_finger_extended(self, hand: HandLandmarks, finger_tip_idx: int) -> bool:
         """
@@ -255,23 +351,12 @@ class HandDetector:
         Returns:
             Number of extended fingers (0-5)
         """
-        extended = 0
-        
         # Check each finger (excluding thumb for now)
-        finger_tips = [
-            HandLandmarks.INDEX_FINGER_TIP,
-            HandLandmarks.MIDDLE_FINGER_TIP,
-            HandLandmarks.RING_FINGER_TIP,
-            HandLandmarks.PINKY_TIP
-        ]
-        
-        for tip_idx in finger_tips:
-            if self.is_finger_extended(hand, tip_idx):
-                extended += 1
+        extended = int(hand.fingers_extended().sum())
         
         # Special handling for thumb (check x-coordinate)
-        thumb_tip = hand.get_landmark(HandLandmarks.THUMB_TIP)
-        thumb_mcp = hand.get_landmark(HandLandmarks.THUMB_MCP)
+        thumb_tip = hand.get_landmark_unchecked(HandLandmarks.THUMB_TIP)
+        thumb_mcp = hand.get_landmark_unchecked(HandLandmarks.THUMB_MCP)
         
         if hand.handedness == "Right":
             if thumb_tip[0] < thumb_mcp[0]:  # Thumb extended to the left
@@ -7,14 +7,48 @@ import pyautogui
 import numpy as np
 from typing import Tuple, Optional
 import logging
+import time
+from ._mouse_kernels import ema_step, map_point, map_and_smooth
+from ._native_mouse import create_backend
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Disable PyAutoGUI fail-safe (moving mouse to corner to abort)
 # We'll implement our own safety mechanisms
 pyautogui.FAILSAFE = False
 
+def _primary_screen_size(physical_pixels: bool) -> Tuple[int, int]:
+    """
+    Get the primary screen size in the units the mouse backend expects
+    
+    Uses Qt when an application is running (it already knows the screen),
+    otherwise falls back to PyAutoGUI. Qt reports logical pixels, so its size
+    is scaled by the screen's device pixel ratio for backends that take
+    physical pixels.
+    
+    Args:
+        physical_pixels: Whether the backend takes physical pixels (Win32/X11)
+                         rather than points (macOS)
+    
+    Returns:
+        Tuple of (width, height)
+    """
+    screen = None
+    try:
+        from PyQt6.QtGui import QGuiApplication
+        if QGuiApplication.instance() is not None:
+            screen = QGuiApplication.primaryScreen()
+    except ImportError:
+        pass
+    
+    if screen is not None:
+        size = screen.size()
+        ratio = screen.devicePixelRatio() if physical_pixels else 1.0
+        return round(size.width() * ratio), round(size.height() * ratio)
+    
+    width, height = pyautogui.size()
+    return width, height
+
 
 class SmoothingFilter:
     """Exponential moving average filter for smooth cursor movement"""
@@ -26,7 +60,7 @@ class SmoothingFilter:
         Args:
             alpha: Smoothing factor (0-1). Lower = more smoothing, higher = more responsive
         """
-        self.alpha = max(0.0, min(1.0, alpha))  # Clamp to [0, 1]
+        self.alpha = 0.0 if alpha < 0.0 else (1.0 if alpha > 1.0 else alpha)  # Clamp to [0, 1]
         self.smoothed_x: Optional[float] = None
         self.smoothed_y: Optional[float] = None
     
@@ -47,8 +81,9 @@ class SmoothingFilter:
             self.smoothed_y = y
         else:
             # Apply EMA: smoothed = alpha * current + (1-alpha) * previous
-            self.smoothed_x = self.alpha * x + (1 - self.alpha) * self.smoothed_x
-            self.smoothed_y = self.alpha * y + (1 - self.alpha) * self.smoothed_y
+            self.smoothed_x, self.smoothed_y = ema_step(
+                self.smoothed_x, self.smoothed_y, x, y, self.alpha
+            )
         
         return self.smoothed_x, self.smoothed_y
     
@@ -80,15 +115,28 @@ class MouseController:
         self.scroll_sensitivity = scroll_sensitivity
         self.acceleration_factor = acceleration_factor
         
+        # Native OS mouse API, bound once (PyAutoGUI only as a fallback)
+        self._backend = create_backend()
+        
         # Monitor management
         self.target_monitor = 0  # 0 means primary or all (standard behavior)
-        self.screen_width, self.screen_height = pyautogui.size()
+        # Queried per controller, so resolution/DPI changes apply on the next tracking start
+        self.screen_width, self.screen_height = _primary_screen_size(self._backend.physical_pixels)
         self.monitor_offset_x = 0
         self.monitor_offset_y = 0
         
         # Define active tracking area (calibrated range)
         self.x_min, self.y_min = 0.1, 0.1
         self.x_max, self.y_max = 0.9, 0.9
+        self._update_scale()
+        
+        # Coalesced cursor moves: only the latest target is sent, at most 120 Hz
+        self._pending: Optional[Tuple[int, int]] = None
+        self._last_flush = 0.0
+        self._min_flush_interval = 1.0 / 120
+        
+        # Last pixel target queued, so unchanged targets skip the OS call
+        self._last_px = (-1, -1)
         
         logger.info(f"Mouse controller initialized. Screen: {self.screen_width}x{self.screen_height}")
     
@@ -98,8 +146,30 @@ class MouseController:
         self.y_min = max(0.0, min(1.0, y_min))
         self.x_max = max(0.0, min(1.0, x_max))
         self.y_max = max(0.0, min(1.0, y_max))
+        self._update_scale()
         logger.info(f"Active area updated: ({self.x_min}, {self.y_min}) to ({self.x_max}, {self.y_max})")
 
+    def _update_scale(self):
+        """Precompute the active-area, screen and sensitivity scale used by the mapping kernel"""
+        range_x = self.x_max - self.x_min
+        range_y = self.y_max - self.y_min
+        
+        if range_x <= 0: range_x = 0.1
+        if range_y <= 0: range_y = 0.1
+        
+        self._scale_x = self.screen_width * self.sensitivity / range_x
+        self._scale_y = self.screen_height * self.sensitivity / range_y
+        # Upper bound of the active area once scaled (screen * sensitivity, the same as
+        # clamping the normalized value to 1 first), kept on screen when sensitivity >= 1
+        self._max_px_x = float(min(self.screen_width * self.sensitivity, self.screen_width - 1))
+        self._max_px_y = float(min(self.screen_height * self.sensitivity, self.screen_height - 1))
+        
+        # Same constants as arrays for batched mapping
+        self._origin = np.array([self.x_min, self.y_min])
+        self._scale = np.array([self._scale_x, self._scale_y])
+        self._bounds = np.array([self._max_px_x, self._max_px_y])
+        self._offset = np.array([self.monitor_offset_x, self.monitor_offset_y], dtype=np.int32)
+
     def map_to_screen(self, x: float, y: float) -> Tuple[int, int]:
         """
         Map normalized hand coordinates (0-1) to screen coordinates
@@ -111,37 +181,51 @@ class MouseController:
         Returns:
             Tuple of (screen_x, screen_y) in pixels
         """
-        # Apply calibrated range
-        range_x = self.x_max - self.x_min
-        range_y = self.y_max - self.y_min
-        
-        if range_x <= 0: range_x = 0.1
-        if range_y <= 0: range_y = 0.1
+        # Apply calibrated range and sensitivity, clamp to the screen and add monitor offset
+        return map_point(
+            x, y, self.x_min, self.y_min, self._scale_x, self._scale_y,
+            self._max_px_x, self._max_px_y, self.monitor_offset_x, self.monitor_offset_y
+        )
 
-        x_adjusted = (x - self.x_min) / range_x
-        y_adjusted = (y - self.y_min) / range_y
-        
-        # Clamp to valid range
-        x_adjusted = max(0.0, min(1.0, x_adjusted))
-        y_adjusted = max(0.0, min(1.0, y_adjusted))
+    def map_batch(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Map a batch of normalized hand coordinates to screen coordinates
         
-        # Map to screen coordinates with sensitivity
-        screen_x = int(x_adjusted * self.screen_width * self.sensitivity)
-        screen_y = int(y_adjusted * self.screen_height * self.sensitivity)
+        Args:
+            xy: (N, 2) array of normalized (x, y) coordinates
+            
+        Returns:
+            (N, 2) int32 array of screen coordinates in pixels
+        """
+        px = np.clip((np.asarray(xy) - self._origin) * self._scale, 0.0, self._bounds)
+        return px.astype(np.int32) + self._offset
+
+    def set_monitor(self, monitor_index: int, width: int, height: int, offset_x: int, offset_y: int,
+                    device_pixel_ratio: float = 1.0):
+        """
+        Set target monitor parameters
         
-        # Add monitor offset
-        screen_x += self.monitor_offset_x
-        screen_y += self.monitor_offset_y
+        Args:
+            monitor_index: Index of the target monitor
+            width: Monitor width in logical pixels (as Qt reports it)
+            height: Monitor height in logical pixels
+            offset_x: Monitor x position in logical pixels
+            offset_y: Monitor y position in logical pixels
+            device_pixel_ratio: Monitor's device pixel ratio, applied for backends
+                                that take physical pixels
+        """
+        if self._backend.physical_pixels and device_pixel_ratio != 1.0:
+            width = round(width * device_pixel_ratio)
+            height = round(height * device_pixel_ratio)
+            offset_x = round(offset_x * device_pixel_ratio)
+            offset_y = round(offset_y * device_pixel_ratio)
         
-        return screen_x, screen_y
-
-    def set_monitor(self, monitor_index: int, width: int, height: int, offset_x: int, offset_y: int):
-        """Set target monitor parameters"""
         self.target_monitor = monitor_index
         self.screen_width = width
         self.screen_height = height
         self.monitor_offset_x = offset_x
         self.monitor_offset_y = offset_y
+        self._update_scale()
         logger.info(f"Monitor {monitor_index} set as target: {width}x{height} offset({offset_x}, {offset_y})")
     
     def move_cursor(self, x: float, y: float, smooth: bool = True):
@@ -154,15 +238,27 @@ class MouseController:
             smooth: Whether to apply smoothing
         """
         try:
-            # Map to screen coordinates
-            target_x, target_y = self.map_to_screen(x, y)
-            
-            # Apply smoothing if enabled
             if smooth:
-                target_x, target_y = self.smoothing_filter.filter(target_x, target_y)
+                # Map to screen coordinates and smooth in a single kernel call
+                f = self.smoothing_filter
+                has_prev = f.smoothed_x is not None and f.smoothed_y is not None
+                target_x, target_y = map_and_smooth(
+                    x, y, self.x_min, self.y_min, self._scale_x, self._scale_y,
+                    self._max_px_x, self._max_px_y, self.monitor_offset_x, self.monitor_offset_y,
+                    f.smoothed_x if has_prev else 0.0,
+                    f.smoothed_y if has_prev else 0.0,
+                    f.alpha, has_prev
+                )
+                f.smoothed_x, f.smoothed_y = target_x, target_y
+            else:
+                # Map to screen coordinates
+                target_x, target_y = self.map_to_screen(x, y)
             
-            # Calculate distance from current mouse position
-            curr_x, curr_y = pyautogui.position()
+            # Calculate distance from current (or still pending) mouse position
+            if self._pending is not None:
+                curr_x, curr_y = self._pending
+            else:
+                curr_x, curr_y = self._backend.position()
             dx = target_x - curr_x
             dy = target_y - curr_y
             distance = np.sqrt(dx**2 + dy**2)
@@ -185,11 +281,38 @@ class MouseController:
                 new_x = max(0, min(self.screen_width - 1, new_x))
                 new_y = max(0, min(self.screen_height - 1, new_y))
                 
-                pyautogui.moveTo(int(new_x), int(new_y), duration=0)
+                target_px = (int(new_x), int(new_y))
+                if target_px == self._last_px:
+                    return
+                self._last_px = target_px
+                self._pending = target_px
+                self.flush()
             
         except Exception as e:
             logger.error(f"Error moving cursor: {e}")
     
+    def flush(self, force: bool = False):
+        """
+        Send the pending cursor move to the OS, rate-limited
+        
+        Superseded targets are dropped; call this regularly from the tracking loop.
+        
+        Args:
+            force: Send immediately regardless of the rate limit
+        """
+        if self._pending is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_flush < self._min_flush_interval:
+            return
+        x, y = self._pending
+        self._pending = None
+        self._last_flush = now
+        try:
+            self._backend.move_to(x, y)
+        except Exception as e:
+            logger.error(f"Error moving cursor: {e}")
+    
     def click(self, button: str = "left"):
         """
         Perform mouse click
@@ -197,12 +320,13 @@ class MouseController:
         Args:
             button: "left" or "right"
         """
+        self.flush(force=True)
         try:
             if button == "left":
-                pyautogui.click()
+                self._backend.click("left")
                 logger.debug("Left click executed")
             elif button == "right":
-                pyautogui.rightClick()
+                self._backend.click("right")
                 logger.debug("Right click executed")
             else:
                 logger.warning(f"Unknown button: {button}")
@@ -211,17 +335,19 @@ class MouseController:
 
     def mouse_down(self, button: str = "left"):
         """Press mouse button down"""
+        self.flush(force=True)
         try:
-            pyautogui.mouseDown(button=button)
-            logger.debug(f"Mouse down: {button}")
+            self._backend.mouse_down(button)
+            logger.debug("Mouse down: %s", button)
         except Exception as e:
             logger.error(f"Error mouse down: {e}")
 
     def mouse_up(self, button: str = "left"):
         """Release mouse button"""
+        self.flush(force=True)
         try:
-            pyautogui.mouseUp(button=button)
-            logger.debug(f"Mouse up: {button}")
+            self._backend.mouse_up(button)
+            logger.debug("Mouse up: %s", button)
         except Exception as e:
             logger.error(f"Error mouse up: {e}")
     
@@ -232,14 +358,15 @@ class MouseController:
         Args:
             delta_y: Vertical scroll amount (positive = down, negative = up)
         """
+        self.flush(force=True)
         try:
             # Convert normalized delta to scroll clicks
             # Negative because screen y increases downward but scroll should be intuitive
             scroll_amount = int(-delta_y * self.scroll_sensitivity * 100)
             
             if scroll_amount != 0:
-                pyautogui.scroll(scroll_amount)
-                logger.debug(f"Scroll executed: {scroll_amount}")
+                self._backend.scroll(scroll_amount)
+                logger.debug("Scroll executed: %d", scroll_amount)
         except Exception as e:
             logger.error(f"Error scrolling: {e}")
     
@@ -251,6 +378,7 @@ class MouseController:
             sensitivity: New sensitivity value
         """
         self.sensitivity = max(0.1, min(5.0, sensitivity))
+        self._update_scale()
         logger.info(f"Sensitivity set to {self.sensitivity}")
     
     def set_smoothing(self, smoothing: float):
@@ -260,7 +388,7 @@ class MouseController:
         Args:
             smoothing: New smoothing value (0-1)
         """
-        self.smoothing_filter.alpha = max(0.0, min(1.0, smoothing))
+        self.smoothing_filter.alpha = 0.0 if smoothing < 0.0 else (1.0 if smoothing > 1.0 else smoothing)
         logger.info(f"Smoothing set to {self.smoothing_filter.alpha}")
     
     def set_scroll_sensitivity(self, sensitivity: float):
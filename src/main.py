@@ -7,11 +7,16 @@ Webcam-based gesture control for mouse operations
 import mediapipe as mp
 
 import sys
+import threading
 import time
+from functools import partial
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer, QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QImage
 import cv2
+import numpy as np
 import logging
+from typing import Optional
 
 from core.camera import CameraManager
 from core.hand_tracker import HandDetector
@@ -30,21 +35,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Config keys of the gestures that can be toggled from the UI
+GESTURE_ENABLE_KEYS = (
+    'cursor_control_enabled',
+    'left_click_enabled',
+    'right_click_enabled',
+    'scroll_enabled',
+)
+
 
-class TrackingWorker(QObject):
-    """Worker thread for hand tracking and gesture detection"""
+class TrackingThread(QThread):
+    """Thread running hand tracking and gesture detection"""
     
     # Signals
-    frame_processed = pyqtSignal(object, bool, str, float)  # frame, hand_detected, gesture, fps
+    frame_ready = pyqtSignal(QImage)  # annotated frame, fitted to the preview
+    status_changed = pyqtSignal(bool, str, float)  # hand_detected, gesture, fps
     error_occurred = pyqtSignal(str)
     hand_position_captured = pyqtSignal(float, float) # normalized x, y
     
+    # Give up after this many back-to-back loop failures
+    MAX_CONSECUTIVE_ERRORS = 10
+    # A loop that ran at least this long before failing starts a new error streak
+    ERROR_STREAK_RESET_S = 5.0
+    
     def __init__(self, config: ConfigManager):
         super().__init__()
         self.config = config
         self.is_running = False
-        self.is_paused = False
+        # Set while tracking runs; cleared to pause (the loop blocks on it)
+        self._run_event = threading.Event()
+        self._run_event.set()
         self.calibration_active = False
+        self.preview_visible = True
+        # Preview frames are fitted to this size before crossing to the GUI thread
+        self.preview_size = (640, 480)
+        self._preview_buf = None
+        self._preview_wrap = None
+        self._preview_scratch = None
+        self.last_frame_id = -1
+        self.last_status = None
+        
+        # Gesture enable flags (pushed from the UI, not re-read every frame)
+        gesture_config = self.config.get_section('gestures')
+        self.cursor_control_enabled = gesture_config.get('cursor_control_enabled', True)
+        self.left_click_enabled = gesture_config.get('left_click_enabled', True)
+        self.right_click_enabled = gesture_config.get('right_click_enabled', True)
+        self.scroll_enabled = gesture_config.get('scroll_enabled', True)
         
         # Initialize components
         self.camera = None
@@ -52,13 +88,24 @@ class TrackingWorker(QObject):
         self.gesture_detector = None
         self.mouse_controller = None
         
-        # FPS tracking
-        self.frame_count = 0
-        self.fps_start_time = time.time()
+        # Gesture type -> action handler returning the gesture name
+        self._gesture_handlers = {
+            GestureType.CURSOR_MOVE: self._do_cursor_move,
+            GestureType.LEFT_CLICK: self._do_left_click,
+            GestureType.RIGHT_CLICK: self._do_right_click,
+            GestureType.DRAG_START: self._do_drag_start,
+            GestureType.DRAG: self._do_drag,
+            GestureType.DRAG_STOP: self._do_drag_stop,
+            GestureType.SCROLL: self._do_scroll,
+        }
+        
+        # FPS tracking (EMA of the inter-frame interval)
+        self._ema_dt = None
+        self._last_frame_time = time.perf_counter()
         self.current_fps = 0.0
         
         # Throttling state
-        self.last_hand_time = time.time()
+        self.last_hand_time = time.perf_counter()
         self.throttle_delay = 0.2  # 5 FPS (1/0.2)
         self.normal_delay = 0.01   # ~30-60 FPS
     
@@ -81,7 +128,8 @@ class TrackingWorker(QObject):
             self.hand_detector = HandDetector(
                 max_hands=tracking_config.get('max_hands', 1),
                 detection_confidence=tracking_config.get('detection_confidence', 0.7),
-                tracking_confidence=tracking_config.get('tracking_confidence', 0.5)
+                tracking_confidence=tracking_config.get('tracking_confidence', 0.5),
+                draw=self.config.get('ui', 'show_landmarks', True)
             )
             
             # Gesture detector
@@ -118,15 +166,46 @@ class TrackingWorker(QObject):
     def run(self):
         """Main tracking loop"""
         self.is_running = True
-        logger.info("Tracking worker started")
+        logger.info("Tracking thread started")
         
+        failures = 0
         while self.is_running:
-            if self.is_paused:
-                time.sleep(0.1)
-                continue
+            started = time.perf_counter()
+            try:
+                self._track()
+            except Exception as e:
+                if time.perf_counter() - started >= self.ERROR_STREAK_RESET_S:
+                    failures = 0
+                failures += 1
+                
+                # Full traceback and a UI report once per streak, short lines after that
+                if failures == 1:
+                    logger.exception(f"Error in tracking loop: {e}")
+                    self.error_occurred.emit(str(e))
+                else:
+                    logger.error(f"Error in tracking loop ({failures} in a row): {e}")
+                
+                if failures >= self.MAX_CONSECUTIVE_ERRORS:
+                    logger.error("Too many consecutive errors, stopping tracking")
+                    self.error_occurred.emit(f"Tracking stopped after repeated errors: {e}")
+                    self.is_running = False
+                    break
+                
+                # Back off before re-entering the loop (0.1 s, doubling up to 1 s)
+                time.sleep(min(0.1 * 2 ** (failures - 1), 1.0))
+        
+        logger.info("Tracking thread stopped")
+    
+    def _track(self):
+        """Inner tracking loop; exceptions propagate to run()"""
+        while self.is_running:
+            # Block without spinning while paused
+            self._run_event.wait()
+            if not self.is_running:
+                break
             
             # --- Smart Throttling ---
-            current_time = time.time()
+            current_time = time.perf_counter()
             if current_time - self.last_hand_time > 10.0:
                 # No hand for 10s, throttle to 5 FPS
                 time.sleep(self.throttle_delay)
@@ -134,52 +213,85 @@ class TrackingWorker(QObject):
                 # Normal operation
                 time.sleep(self.normal_delay)
             
-            try:
-                # Read frame from camera
-                success, frame = self.camera.read_frame()
-                if not success or frame is None:
-                    continue
-                
-                # Detect hand
-                hand_landmarks, annotated_frame = self.hand_detector.detect(frame)
-                hand_detected = hand_landmarks is not None
-                
-                if hand_detected:
-                    self.last_hand_time = time.time()
-                    # Get index finger position
-                    index_pos = hand_landmarks.get_landmark(8)[:2] # x, y
-                    
-                    if self.calibration_active:
-                        self.hand_position_captured.emit(index_pos[0], index_pos[1])
-                    else:
-                        # Detect gesture
-                        gesture_type, gesture_data = self.gesture_detector.detect_gesture(hand_landmarks)
-                        # Execute mouse actions
-                        gesture_name = self._execute_gesture(gesture_type, gesture_data)
-                else:
-                    gesture_name = "None"
-                
-                # Calculate FPS
-                self.frame_count += 1
-                elapsed = time.time() - self.fps_start_time
-                if elapsed >= 1.0:
-                    self.current_fps = self.frame_count / elapsed
-                    self.frame_count = 0
-                    self.fps_start_time = time.time()
-                
-                # Emit processed frame
-                self.frame_processed.emit(
-                    annotated_frame,
-                    hand_detected,
-                    gesture_name if not self.calibration_active else "Calibration",
-                    self.current_fps
-                )
-                
-            except Exception as e:
-                logger.error(f"Error in tracking loop: {e}")
-                self.error_occurred.emit(str(e))
+            # Deliver any cursor move deferred by the rate limiter
+            self.mouse_controller.flush()
+            
+            # Read frame from camera, skipping frames already processed
+            frame_id, frame = self.camera.read_frame_with_id()
+            if frame is None or frame_id == self.last_frame_id:
+                continue
+            self.last_frame_id = frame_id
+            
+            # Detect hand
+            hand_landmarks, annotated_frame = self.hand_detector.detect(
+                frame, draw=self.preview_visible and self.hand_detector.draw
+            )
+            hand_detected = hand_landmarks is not None
+            
+            if not hand_detected:
+                gesture_name = "Calibration" if self.calibration_active else "None"
+            elif self.calibration_active:
+                self.last_hand_time = time.perf_counter()
+                index_pos = hand_landmarks.get_landmark_unchecked(8)  # x, y, z
+                self.hand_position_captured.emit(float(index_pos[0]), float(index_pos[1]))
+                gesture_name = "Calibration"
+            else:
+                self.last_hand_time = time.perf_counter()
+                # Detect gesture
+                gesture_type, gesture_data = self.gesture_detector.detect_gesture(hand_landmarks)
+                # Execute mouse actions
+                gesture_name = self._execute_gesture(gesture_type, gesture_data)
+            
+            # Calculate FPS
+            now = time.perf_counter()
+            dt = now - self._last_frame_time
+            self._last_frame_time = now
+            self._ema_dt = dt if self._ema_dt is None else 0.9 * self._ema_dt + 0.1 * dt
+            if self._ema_dt > 0:
+                self.current_fps = 1.0 / self._ema_dt
+            
+            # Frames are only needed while the preview is on screen
+            if self.preview_visible:
+                self.frame_ready.emit(self._preview_image(annotated_frame))
+            
+            # Emit status only when it changes (FPS in 0.5 steps)
+            status = (hand_detected, gesture_name, round(self.current_fps * 2))
+            if status != self.last_status:
+                self.last_status = status
+                self.status_changed.emit(hand_detected, gesture_name, self.current_fps)
+    
+    def _preview_image(self, frame) -> QImage:
+        """
+        Fit a frame to the preview size and wrap it in a QImage for the GUI thread
         
-        logger.info("Tracking worker stopped")
+        Frames are converted into a reused buffer in Format_RGB32 (BGRA bytes),
+        the raster paint engine's native format, so the GUI only has to blit the
+        image. The emitted QImage is a copy that owns its pixels, so it stays valid
+        however long it waits in the event queue or is held by the view.
+        """
+        height, width = frame.shape[:2]
+        max_width, max_height = self.preview_size
+        scale = min(max_width / width, max_height / height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        
+        buf = self._preview_buf
+        if buf is None or buf.shape[:2] != (size[1], size[0]):
+            buf = np.empty((size[1], size[0], 4), dtype=np.uint8)
+            self._preview_buf = buf
+            self._preview_wrap = QImage(buf.data, size[0], size[1], buf.strides[0],
+                                        QImage.Format.Format_RGB32)
+        
+        # Sliced views (e.g. frame[:, ::-1]) need a contiguous copy; captures never do
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        if size != (width, height):
+            if self._preview_scratch is None or self._preview_scratch.shape[:2] != (size[1], size[0]):
+                self._preview_scratch = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            cv2.resize(frame, size, dst=self._preview_scratch, interpolation=cv2.INTER_AREA)
+            frame = self._preview_scratch
+        cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=buf)
+        # Detach from buf, which is rewritten on the next frame
+        return self._preview_wrap.copy()
     
     def _execute_gesture(self, gesture_type: GestureType, gesture_data: dict) -> str:
         """
@@ -192,71 +304,103 @@ class TrackingWorker(QObject):
         Returns:
             Human-readable gesture name
         """
-        gesture_config = self.config.get_section('gestures')
-        
-        if gesture_type == GestureType.CURSOR_MOVE:
-            if gesture_config.get('cursor_control_enabled', True):
-                position = gesture_data.get('position', (0.5, 0.5))
-                self.mouse_controller.move_cursor(position[0], position[1])
-                return "Cursor Move"
-        
-        elif gesture_type == GestureType.LEFT_CLICK:
-            if gesture_config.get('left_click_enabled', True):
-                self.mouse_controller.click('left')
-                return "Left Click"
-        
-        elif gesture_type == GestureType.RIGHT_CLICK:
-            if gesture_config.get('right_click_enabled', True):
-                self.mouse_controller.click('right')
-                return "Right Click"
-        
-        elif gesture_type == GestureType.DRAG_START:
-            if gesture_config.get('left_click_enabled', True):
-                self.mouse_controller.mouse_down('left')
-                return "Drag Start"
-        
-        elif gesture_type == GestureType.DRAG:
-            if gesture_config.get('left_click_enabled', True):
-                position = gesture_data.get('position', (0.5, 0.5))
-                self.mouse_controller.move_cursor(position[0], position[1])
-                return "Dragging"
-        
-        elif gesture_type == GestureType.DRAG_STOP:
-            if gesture_config.get('left_click_enabled', True):
-                self.mouse_controller.mouse_up('left')
-                return "Drag Stop"
-        
-        elif gesture_type == GestureType.SCROLL:
-            if gesture_config.get('scroll_enabled', True):
-                delta_y = gesture_data.get('delta_y', 0)
-                if delta_y != 0:
-                    self.mouse_controller.scroll(delta_y)
-                    return "Scrolling"
-                return "Scroll Mode"
-        
-        return "None"
+        handler = self._gesture_handlers.get(gesture_type)
+        if handler is None:
+            return "None"
+        return handler(gesture_data)
+    
+    def _do_cursor_move(self, gesture_data: dict) -> str:
+        if not self.cursor_control_enabled:
+            return "None"
+        position = gesture_data.get('position', (0.5, 0.5))
+        self.mouse_controller.move_cursor(position[0], position[1])
+        return "Cursor Move"
+    
+    def _do_left_click(self, gesture_data: dict) -> str:
+        if not self.left_click_enabled:
+            return "None"
+        self.mouse_controller.click('left')
+        return "Left Click"
+    
+    def _do_right_click(self, gesture_data: dict) -> str:
+        if not self.right_click_enabled:
+            return "None"
+        self.mouse_controller.click('right')
+        return "Right Click"
+    
+    def _do_drag_start(self, gesture_data: dict) -> str:
+        if not self.left_click_enabled:
+            return "None"
+        self.mouse_controller.mouse_down('left')
+        return "Drag Start"
+    
+    def _do_drag(self, gesture_data: dict) -> str:
+        if not self.left_click_enabled:
+            return "None"
+        position = gesture_data.get('position', (0.5, 0.5))
+        self.mouse_controller.move_cursor(position[0], position[1])
+        return "Dragging"
+    
+    def _do_drag_stop(self, gesture_data: dict) -> str:
+        if not self.left_click_enabled:
+            return "None"
+        self.mouse_controller.mouse_up('left')
+        return "Drag Stop"
+    
+    def _do_scroll(self, gesture_data: dict) -> str:
+        if not self.scroll_enabled:
+            return "None"
+        delta_y = gesture_data.get('delta_y', 0)
+        if delta_y != 0:
+            self.mouse_controller.scroll(delta_y)
+            return "Scrolling"
+        return "Scroll Mode"
     
     def stop(self):
-        """Stop the tracking worker"""
+        """Stop the tracking loop and release the camera and detector"""
         self.is_running = False
+        self._run_event.set()  # Wake the loop if paused so it can exit
+        self.wait()
         if self.camera:
             self.camera.stop()
         if self.hand_detector:
             self.hand_detector.close()
     
+    def set_preview_visible(self, visible: bool):
+        """Set whether the camera preview is shown (landmarks are only drawn when visible)"""
+        self.preview_visible = visible
+    
+    def set_preview_size(self, width: int, height: int):
+        """Set the size of the preview area that frames are fitted to"""
+        self.preview_size = (width, height)
+    
     def pause(self):
         """Pause tracking"""
-        self.is_paused = True
+        self._run_event.clear()
     
     def resume(self):
         """Resume tracking"""
-        self.is_paused = False
+        self._run_event.set()
     
-    def update_mouse_settings(self, sensitivity: float, smoothing: float):
-        """Update mouse controller settings"""
+    def update_mouse_settings(self, sensitivity: Optional[float] = None, smoothing: Optional[float] = None):
+        """Update mouse controller settings (None leaves a value unchanged)"""
         if self.mouse_controller:
-            self.mouse_controller.set_sensitivity(sensitivity)
-            self.mouse_controller.set_smoothing(smoothing)
+            if sensitivity is not None:
+                self.mouse_controller.set_sensitivity(sensitivity)
+            if smoothing is not None:
+                self.mouse_controller.set_smoothing(smoothing)
+    
+    def update_gesture_enabled(self, key: str, enabled: bool):
+        """
+        Enable or disable a gesture
+        
+        Args:
+            key: Gesture config key ('cursor_control_enabled', 'left_click_enabled',
+                 'right_click_enabled' or 'scroll_enabled')
+            enabled: Whether the gesture is enabled
+        """
+        if key in GESTURE_ENABLE_KEYS:
+            setattr(self, key, enabled)
 
     def update_gesture_settings(self, pinch_threshold: float, scroll_threshold: float, click_debounce: float):
         """Update gesture detector settings"""
@@ -298,7 +442,6 @@ class GestureMouseApp:
         
         # Tracking components
         self.tracking_thread = None
-        self.tracking_worker = None
         self.is_tracking = False
         
         # Connect signals
@@ -321,16 +464,16 @@ class GestureMouseApp:
         
         # Gesture enable/disable signals
         self.main_window.cursor_control_cb.toggled.connect(
-            lambda checked: self.config.set('gestures', 'cursor_control_enabled', checked)
+            partial(self._on_gesture_toggled, 'cursor_control_enabled')
         )
         self.main_window.left_click_cb.toggled.connect(
-            lambda checked: self.config.set('gestures', 'left_click_enabled', checked)
+            partial(self._on_gesture_toggled, 'left_click_enabled')
         )
         self.main_window.right_click_cb.toggled.connect(
-            lambda checked: self.config.set('gestures', 'right_click_enabled', checked)
+            partial(self._on_gesture_toggled, 'right_click_enabled')
         )
         self.main_window.scroll_cb.toggled.connect(
-            lambda checked: self.config.set('gestures', 'scroll_enabled', checked)
+            partial(self._on_gesture_toggled, 'scroll_enabled')
         )
         
         # System tray signals
@@ -339,6 +482,12 @@ class GestureMouseApp:
         self.tray_manager.resume_tracking_requested.connect(self._on_resume_tracking)
         self.tray_manager.exit_requested.connect(self._on_exit)
     
+    def _on_gesture_toggled(self, key: str, checked: bool):
+        """Handle gesture enable checkbox toggle"""
+        self.config.set('gestures', key, checked)
+        if self.tracking_thread:
+            self.tracking_thread.update_gesture_enabled(key, checked)
+    
     def _on_calibrate_clicked(self):
         """Handle calibrate button click"""
         if not self.is_tracking:
@@ -349,20 +498,20 @@ class GestureMouseApp:
         self.calibration_wizard.calibration_complete.connect(self._on_calibration_complete)
         self.calibration_wizard.calibration_cancelled.connect(self._on_calibration_cancelled)
         
-        # Connect worker signal to wizard
-        self.tracking_worker.hand_position_captured.connect(self.calibration_wizard.capture_point)
-        self.tracking_worker.calibration_active = True
+        # Connect tracking signal to wizard
+        self.tracking_thread.hand_position_captured.connect(self.calibration_wizard.capture_point)
+        self.tracking_thread.calibration_active = True
         
         self.calibration_wizard.show()
         logger.info("Calibration started")
 
     def _on_calibration_complete(self, x_min, y_min, x_max, y_max):
         """Handle calibration completion"""
-        self.tracking_worker.calibration_active = False
+        self.tracking_thread.calibration_active = False
         
         # Update mouse controller
-        if self.tracking_worker.mouse_controller:
-            self.tracking_worker.mouse_controller.set_active_area(x_min, y_min, x_max, y_max)
+        if self.tracking_thread.mouse_controller:
+            self.tracking_thread.mouse_controller.set_active_area(x_min, y_min, x_max, y_max)
             
         # Save to config
         self.config.set('mouse', 'active_area', {
@@ -376,7 +525,7 @@ class GestureMouseApp:
 
     def _on_calibration_cancelled(self):
         """Handle calibration cancellation"""
-        self.tracking_worker.calibration_active = False
+        self.tracking_thread.calibration_active = False
         logger.info("Calibration cancelled")
     
     def _on_settings_clicked(self):
@@ -391,17 +540,17 @@ class GestureMouseApp:
                     self.config.set(section, key, value)
             self.config.save()
             
-            # Update worker if running
-            if self.tracking_worker:
+            # Update tracking thread if running
+            if self.tracking_thread:
                 gestures = new_settings['gestures']
-                self.tracking_worker.update_gesture_settings(
+                self.tracking_thread.update_gesture_settings(
                     gestures['pinch_threshold'],
                     gestures['scroll_threshold'],
                     gestures['click_debounce']
                 )
                 
                 tracking = new_settings['tracking']
-                self.tracking_worker.update_tracking_settings(
+                self.tracking_thread.update_tracking_settings(
                     tracking['detection_confidence'],
                     tracking['tracking_confidence']
                 )
@@ -439,9 +588,10 @@ class GestureMouseApp:
         self.config.set('mouse', 'target_monitor', index)
         self.config.save()
         
-        if self.tracking_worker and self.tracking_worker.mouse_controller:
-            self.tracking_worker.mouse_controller.set_monitor(
-                index, geo.width(), geo.height(), geo.x(), geo.y()
+        if self.tracking_thread and self.tracking_thread.mouse_controller:
+            self.tracking_thread.mouse_controller.set_monitor(
+                index, geo.width(), geo.height(), geo.x(), geo.y(),
+                screen.devicePixelRatio()
             )
         
         logger.info(f"Target monitor changed to index {index}")
@@ -457,22 +607,22 @@ class GestureMouseApp:
         """Start tracking"""
         logger.info("Starting tracking...")
         
-        # Create tracking thread and worker
-        self.tracking_thread = QThread()
-        self.tracking_worker = TrackingWorker(self.config)
-        self.tracking_worker.moveToThread(self.tracking_thread)
-        
-        # Connect worker signals
-        self.tracking_worker.frame_processed.connect(self._on_frame_processed)
-        self.tracking_worker.error_occurred.connect(self._on_tracking_error)
+        # Create tracking thread
+        self.tracking_thread = TrackingThread(self.config)
+        preview_size = self.main_window.camera_view.contentsRect().size()
+        self.tracking_thread.set_preview_size(preview_size.width(), preview_size.height())
         
         # Connect thread signals
-        self.tracking_thread.started.connect(self.tracking_worker.run)
-        self.tracking_thread.finished.connect(self.tracking_thread.deleteLater)
+        self.tracking_thread.frame_ready.connect(self._on_frame_ready)
+        self.tracking_thread.status_changed.connect(self._on_status_changed)
+        self.tracking_thread.error_occurred.connect(self._on_tracking_error)
+        self.tracking_thread.finished.connect(
+            partial(self._on_tracking_finished, self.tracking_thread)
+        )
         
-        # Initialize worker
-        if not self.tracking_worker.initialize():
-            logger.error("Failed to initialize tracking worker")
+        # Initialize components
+        if not self.tracking_thread.initialize():
+            logger.error("Failed to initialize tracking thread")
             return
         
         # Start thread
@@ -490,12 +640,8 @@ class GestureMouseApp:
         """Stop tracking"""
         logger.info("Stopping tracking...")
         
-        if self.tracking_worker:
-            self.tracking_worker.stop()
-        
         if self.tracking_thread:
-            self.tracking_thread.quit()
-            self.tracking_thread.wait()
+            self.tracking_thread.stop()
         
         self.is_tracking = False
         
@@ -508,9 +654,12 @@ class GestureMouseApp:
         
         logger.info("Tracking stopped")
     
-    def _on_frame_processed(self, frame, hand_detected: bool, gesture: str, fps: float):
-        """Handle processed frame from tracking worker"""
-        self.main_window.update_camera_feed(frame)
+    def _on_frame_ready(self, image: QImage):
+        """Handle processed frame from tracking thread"""
+        self.main_window.update_camera_feed(image)
+    
+    def _on_status_changed(self, hand_detected: bool, gesture: str, fps: float):
+        """Handle tracking status change from tracking thread"""
         self.main_window.update_hand_detected(hand_detected)
         self.main_window.update_gesture(gesture)
         self.main_window.update_fps(fps)
@@ -519,6 +668,11 @@ class GestureMouseApp:
         if gesture not in ["None", "Cursor Move", "Dragging", "Scroll Mode"]:
             self.osd.show_message(gesture)
     
+    def _on_tracking_finished(self, thread: TrackingThread):
+        """Bring the UI back to stopped when the tracking thread gave up on its own"""
+        if thread is self.tracking_thread and self.is_tracking:
+            self._stop_tracking()
+    
     def _on_tracking_error(self, error: str):
         """Handle tracking error"""
         logger.error(f"Tracking error: {error}")
@@ -528,25 +682,21 @@ class GestureMouseApp:
         """Handle sensitivity slider change"""
         sensitivity = value / 3.0  # Map 1-10 to ~0.3-3.3
         self.config.set('mouse', 'sensitivity', sensitivity)
-        if self.tracking_worker:
-            self.tracking_worker.update_mouse_settings(
-                sensitivity,
-                self.config.get('mouse', 'smoothing', 0.3)
-            )
+        if self.tracking_thread:
+            self.tracking_thread.update_mouse_settings(sensitivity=sensitivity)
     
     def _on_smoothing_changed(self, value: int):
         """Handle smoothing slider change"""
         smoothing = value / 10.0  # Map 1-10 to 0.1-1.0
         self.config.set('mouse', 'smoothing', smoothing)
-        if self.tracking_worker:
-            self.tracking_worker.update_mouse_settings(
-                self.config.get('mouse', 'sensitivity', 1.5),
-                smoothing
-            )
+        if self.tracking_thread:
+            self.tracking_thread.update_mouse_settings(smoothing=smoothing)
     
     def _on_minimize_clicked(self):
         """Handle minimize button click"""
         self.main_window.hide()
+        if self.tracking_thread:
+            self.tracking_thread.set_preview_visible(False)
         self.tray_manager.show_message(
             "GestureMouse",
             "Application minimized to system tray"
@@ -556,17 +706,19 @@ class GestureMouseApp:
         """Handle show window request from tray"""
         self.main_window.show()
         self.main_window.activateWindow()
+        if self.tracking_thread:
+            self.tracking_thread.set_preview_visible(True)
     
     def _on_pause_tracking(self):
         """Handle pause tracking request"""
-        if self.tracking_worker:
-            self.tracking_worker.pause()
+        if self.tracking_thread:
+            self.tracking_thread.pause()
             self.tray_manager.update_tracking_status(False)
     
     def _on_resume_tracking(self):
         """Handle resume tracking request"""
-        if self.tracking_worker:
-            self.tracking_worker.resume()
+        if self.tracking_thread:
+            self.tracking_thread.resume()
             self.tray_manager.update_tracking_status(True)
     
     def _on_window_closing(self):
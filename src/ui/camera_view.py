@@ -0,0 +1,58 @@
+"""
+Camera feed view for GestureMouse
+Paints the latest frame straight from a QImage, without QLabel/QPixmap conversion
+"""
+
+from typing import Optional
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtGui import QImage, QPainter, QColor, QPen
+
+
+class CameraView(QWidget):
+    """Widget that draws the camera feed image centered in its contents area"""
+
+    BORDER_WIDTH = 2
+
+    def __init__(self, placeholder: str = "", parent=None):
+        super().__init__(parent)
+        self._image: Optional[QImage] = None
+        self._placeholder = placeholder
+
+        # Every pixel is painted in paintEvent, so Qt can skip erasing the background
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setContentsMargins(self.BORDER_WIDTH, self.BORDER_WIDTH,
+                                self.BORDER_WIDTH, self.BORDER_WIDTH)
+
+    def set_image(self, image: Optional[QImage]):
+        """
+        Show an image (scheduled for the next paint)
+
+        Args:
+            image: Image to draw, already at display size. It must own its pixels
+                   (not wrap a buffer that is reused), since it is kept for repaints.
+        """
+        self._image = image
+        self.update()
+
+    def paintEvent(self, event):
+        """Draw the border, then the image (or placeholder text) centered inside it"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#000"))
+
+        pen = QPen(QColor("#333"))
+        pen.setWidth(self.BORDER_WIDTH)
+        painter.setPen(pen)
+        half = self.BORDER_WIDTH // 2
+        painter.drawRect(self.rect().adjusted(half, half, -half, -half))
+
+        contents = self.contentsRect()
+        if self._image is not None:
+            x = contents.x() + (contents.width() - self._image.width()) // 2
+            y = contents.y() + (contents.height() - self._image.height()) // 2
+            painter.drawImage(QPoint(x, y), self._image)
+        elif self._placeholder:
+            painter.setPen(QColor("#ccc"))
+            painter.drawText(contents, Qt.AlignmentFlag.AlignCenter, self._placeholder)
+
+        painter.end()
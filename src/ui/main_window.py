@@ -5,13 +5,12 @@ Main window UI for GestureMouse application
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QSlider, QCheckBox, QComboBox,
                              QGroupBox, QGridLayout)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QImage, QPixmap, QCloseEvent
-import cv2
-import numpy as np
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QCloseEvent
 import logging
 
-logging.basicConfig(level=logging.INFO)
+from .camera_view import CameraView
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +20,36 @@ class MainWindow(QMainWindow):
     # Signal emitted when window is closed
     closing = pyqtSignal()
     
+    # Stylesheets for the on/off states, built once and reused
+    _BTN_GREEN_QSS = """
+        QPushButton {
+            background-color: #4CAF50;
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #45a049;
+        }
+    """
+    _BTN_RED_QSS = """
+        QPushButton {
+            background-color: #f44336;
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #da190b;
+        }
+    """
+    _LBL_GREEN_QSS = "font-size: 14px; font-weight: bold; color: #4CAF50;"
+    _LBL_RED_QSS = "font-size: 14px; font-weight: bold; color: #f44336;"
+    _HAND_YES_QSS = "font-weight: bold; color: #4CAF50;"
+    _HAND_NO_QSS = "font-weight: bold; color: #f44336;"
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GestureMouse - Webcam Gesture Control")
@@ -29,6 +58,20 @@ class MainWindow(QMainWindow):
         # Initialize UI components
         self.init_ui()
         
+        # Paint the camera feed at most once per display refresh
+        self._paint_timer = QElapsedTimer()
+        self._paint_timer.start()
+        self._min_paint_ms = int(1000 / max(30.0, self.screen().refreshRate()))
+        
+        # Status label updates are coalesced and applied at most every 100 ms
+        self._pending_status = {}
+        self._shown_status = {'hand': False, 'gesture': "None", 'fps': "0"}
+        self._shown_tracking = False
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+        
         logger.info("Main window initialized")
     
     def init_ui(self):
@@ -42,13 +85,12 @@ class MainWindow(QMainWindow):
         top_layout = QHBoxLayout()
         
         # Camera feed
-        self.camera_label = QLabel()
-        self.camera_label.setMinimumSize(640, 480)
-        self.camera_label.setMaximumSize(640, 480)
-        self.camera_label.setStyleSheet("border: 2px solid #333; background-color: #000;")
-        self.camera_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.camera_label.setText("Camera feed will appear here")
-        top_layout.addWidget(self.camera_label)
+        self.camera_view = CameraView("Camera feed will appear here")
+        # Contents area of exactly 640x480 inside the border, so camera frames are shown unscaled
+        border = 2 * CameraView.BORDER_WIDTH
+        self.camera_view.setMinimumSize(640 + border, 480 + border)
+        self.camera_view.setMaximumSize(640 + border, 480 + border)
+        top_layout.addWidget(self.camera_view)
         
         # Status panel
         status_group = self.create_status_panel()
@@ -69,18 +111,7 @@ class MainWindow(QMainWindow):
         
         self.start_button = QPushButton("Start Tracking")
         self.start_button.setMinimumHeight(40)
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.start_button.setStyleSheet(self._BTN_GREEN_QSS)
         button_layout.addWidget(self.start_button)
         
         self.minimize_button = QPushButton("Minimize to Tray")
@@ -104,7 +135,7 @@ class MainWindow(QMainWindow):
         
         # Tracking status
         self.status_label = QLabel("● Stopped")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #f44336;")
+        self.status_label.setStyleSheet(self._LBL_RED_QSS)
         layout.addWidget(self.status_label)
         
         layout.addSpacing(10)
@@ -113,7 +144,7 @@ class MainWindow(QMainWindow):
         hand_layout = QHBoxLayout()
         hand_layout.addWidget(QLabel("Hand Detected:"))
         self.hand_detected_label = QLabel("✗ No")
-        self.hand_detected_label.setStyleSheet("font-weight: bold; color: #f44336;")
+        self.hand_detected_label.setStyleSheet(self._HAND_NO_QSS)
         hand_layout.addWidget(self.hand_detected_label)
         hand_layout.addStretch()
         layout.addLayout(hand_layout)
@@ -204,43 +235,38 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.camera_combo, 2, 1, 1, 2)
         
         # Connect slider signals
-        self.sensitivity_slider.valueChanged.connect(
-            lambda v: self.sensitivity_value_label.setText(str(v))
-        )
-        self.smoothing_slider.valueChanged.connect(
-            lambda v: self.smoothing_value_label.setText(str(v))
-        )
+        self.sensitivity_slider.valueChanged.connect(self._on_sensitivity_value_changed)
+        self.smoothing_slider.valueChanged.connect(self._on_smoothing_value_changed)
         
         group.setLayout(layout)
         return group
     
-    def update_camera_feed(self, frame: np.ndarray):
+    @pyqtSlot(int)
+    def _on_sensitivity_value_changed(self, value: int):
+        """Show the current sensitivity slider value"""
+        self.sensitivity_value_label.setText(str(value))
+    
+    @pyqtSlot(int)
+    def _on_smoothing_value_changed(self, value: int):
+        """Show the current smoothing slider value"""
+        self.smoothing_value_label.setText(str(value))
+    
+    def update_camera_feed(self, image: QImage):
         """
         Update the camera feed display
         
         Args:
-            frame: Frame to display (BGR format)
+            image: Frame image already fitted to the camera view (built by the tracking thread)
         """
-        if frame is None:
+        if image is None:
             return
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Resize to fit label if needed
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        
-        # Convert to QImage
-        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        # Drop frames arriving faster than the display refreshes
+        if self._paint_timer.elapsed() < self._min_paint_ms:
+            return
+        self._paint_timer.restart()
         
-        # Convert to QPixmap and display
-        pixmap = QPixmap.fromImage(qt_image)
-        self.camera_label.setPixmap(pixmap.scaled(
-            self.camera_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        ))
+        self.camera_view.set_image(image)
     
     def update_status(self, is_tracking: bool):
         """
@@ -249,70 +275,74 @@ class MainWindow(QMainWindow):
         Args:
             is_tracking: Whether tracking is active
         """
+        if is_tracking == self._shown_tracking:
+            return
+        self._shown_tracking = is_tracking
+        
         if is_tracking:
             self.status_label.setText("● Tracking")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #4CAF50;")
+            self.status_label.setStyleSheet(self._LBL_GREEN_QSS)
             self.start_button.setText("Stop Tracking")
-            self.start_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #da190b;
-                }
-            """)
+            self.start_button.setStyleSheet(self._BTN_RED_QSS)
         else:
             self.status_label.setText("● Stopped")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #f44336;")
+            self.status_label.setStyleSheet(self._LBL_RED_QSS)
             self.start_button.setText("Start Tracking")
-            self.start_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
+            self.start_button.setStyleSheet(self._BTN_GREEN_QSS)
     
     def update_hand_detected(self, detected: bool):
         """
-        Update hand detection status
+        Update hand detection status (applied on the next status flush)
         
         Args:
             detected: Whether hand is detected
         """
-        if detected:
-            self.hand_detected_label.setText("✓ Yes")
-            self.hand_detected_label.setStyleSheet("font-weight: bold; color: #4CAF50;")
-        else:
-            self.hand_detected_label.setText("✗ No")
-            self.hand_detected_label.setStyleSheet("font-weight: bold; color: #f44336;")
+        self._queue_status('hand', detected)
     
     def update_gesture(self, gesture: str):
         """
-        Update active gesture display
+        Update active gesture display (applied on the next status flush)
         
         Args:
             gesture: Name of active gesture
         """
-        self.gesture_label.setText(gesture)
+        self._queue_status('gesture', gesture)
     
     def update_fps(self, fps: float):
         """
-        Update FPS display
+        Update FPS display (applied on the next status flush)
         
         Args:
             fps: Current FPS
         """
-        self.fps_label.setText(f"{fps:.1f}")
+        # Whole numbers above 15 FPS, so the text changes less often
+        self._queue_status('fps', f"{fps:.0f}" if fps > 15 else f"{fps:.1f}")
+    
+    def _queue_status(self, key: str, value):
+        """Record a status value and schedule a flush if none is pending"""
+        self._pending_status[key] = value
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """Apply queued status values, touching only labels whose value changed"""
+        pending, self._pending_status = self._pending_status, {}
+        for key, value in pending.items():
+            if self._shown_status.get(key) == value:
+                continue
+            self._shown_status[key] = value
+            
+            if key == 'hand':
+                if value:
+                    self.hand_detected_label.setText("✓ Yes")
+                    self.hand_detected_label.setStyleSheet(self._HAND_YES_QSS)
+                else:
+                    self.hand_detected_label.setText("✗ No")
+                    self.hand_detected_label.setStyleSheet(self._HAND_NO_QSS)
+            elif key == 'gesture':
+                self.gesture_label.setText(value)
+            elif key == 'fps':
+                self.fps_label.setText(value)
     
     def closeEvent(self, event: QCloseEvent):
         """Handle window close event"""
@@ -0,0 +1,41 @@
+"""
+Compiled kernel for batched coordinate mapping
+Uses the ahead-of-time compiled extension when it has been built,
+otherwise Numba JIT when installed
+"""
+
+import numpy as np
+
+from core._jit import njit, HAS_NUMBA
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _map_points_jit(pts, inv_w, inv_h, ax, bx, ay, by, max_x, max_y, out):
+    """
+    Map (N, 2) camera coordinates to screen pixels, writing int32 results into out
+    
+    Calibration and screen scale are fused per axis into screen = a * normalized + b.
+    """
+    for i in range(pts.shape[0]):
+        # Normalize and clamp
+        x = min(max(pts[i, 0] * inv_w, 0.0), 1.0)
+        y = min(max(pts[i, 1] * inv_h, 0.0), 1.0)
+        
+        # Apply calibration and map to screen, within bounds
+        out[i, 0] = int(min(max(ax * x + bx, 0.0), max_x))
+        out[i, 1] = int(min(max(ay * y + by, 0.0), max_y))
+
+
+try:
+    # Built by utils._mapper_kernels_aot; no compilation at startup
+    from ._mapper_kernels_compiled import map_points
+    HAS_KERNEL = True
+except ImportError:
+    map_points = _map_points_jit
+    # Without Numba the loop is plain Python; callers use NumPy instead
+    HAS_KERNEL = HAS_NUMBA
+    
+    if HAS_KERNEL:
+        # Compile on import so the first mapped frame doesn't stall
+        map_points(np.zeros((1, 2), dtype=np.float32), 1.0, 1.0, 1920.0, 0.0, 1080.0, 0.0,
+                   1919.0, 1079.0, np.empty((1, 2), dtype=np.int32))
@@ -0,0 +1,26 @@
+"""
+Ahead-of-time build of the coordinate mapping kernel
+Run from the src directory with Numba installed:
+
+    python -m utils._mapper_kernels_aot
+
+This writes utils/_mapper_kernels_compiled.<ext>, which utils._mapper_kernels
+imports in place of the JIT version.
+"""
+
+import os
+from numba.pycc import CC
+
+from ._mapper_kernels import _map_points_jit
+
+cc = CC('_mapper_kernels_compiled')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('map_points', 'void(f4[:, ::1], f8, f8, f8, f8, f8, f8, f8, f8, i4[:, ::1])')
+def map_points(pts, inv_w, inv_h, ax, bx, ay, by, max_x, max_y, out):
+    _map_points_jit(pts, inv_w, inv_h, ax, bx, ay, by, max_x, max_y, out)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,96 @@
+"""
+Numba jitclass versions of the scalar smoothing filters
+Lets tracking code that is itself compiled in nopython mode hold filters and
+call update() without leaving compiled code. Requires Numba.
+"""
+
+import math
+
+from numba import float64
+from numba.experimental import jitclass
+
+from ._smoothing_kernels import _one_euro_step_jit, _kalman_step_jit
+
+
+@jitclass([
+    ('alpha', float64),
+    ('value', float64),
+])
+class ExponentialMovingAverageJIT:
+    """Exponential Moving Average filter (value is NaN until the first sample)"""
+    
+    def __init__(self, alpha=0.3):
+        self.alpha = 0.0 if alpha < 0.0 else (1.0 if alpha > 1.0 else alpha)
+        self.value = math.nan
+    
+    def update(self, new_value):
+        if math.isnan(self.value):
+            self.value = new_value
+        else:
+            self.value = self.alpha * new_value + (1.0 - self.alpha) * self.value
+        return self.value
+    
+    def reset(self):
+        self.value = math.nan
+
+
+@jitclass([
+    ('min_cutoff', float64),
+    ('beta', float64),
+    ('d_cutoff', float64),
+    ('x_prev', float64),
+    ('dx_prev', float64),
+    ('t_prev', float64),
+])
+class OneEuroFilterJIT:
+    """One Euro Filter (x_prev is NaN until the first sample)"""
+    
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x_prev = math.nan
+        self.dx_prev = 0.0
+        self.t_prev = math.nan
+    
+    def update(self, x, t):
+        x_smoothed, dx_smoothed = _one_euro_step_jit(x, t, self.x_prev, self.dx_prev, self.t_prev,
+                                                     self.min_cutoff, self.beta, self.d_cutoff)
+        self.x_prev = x_smoothed
+        self.dx_prev = dx_smoothed
+        self.t_prev = t
+        return x_smoothed
+    
+    def reset(self):
+        self.x_prev = math.nan
+        self.dx_prev = 0.0
+        self.t_prev = math.nan
+
+
+@jitclass([
+    ('process_variance', float64),
+    ('measurement_variance', float64),
+    ('estimate', float64),
+    ('error_estimate', float64),
+])
+class KalmanFilterJIT:
+    """Simple 1D Kalman filter (estimate is NaN until the first measurement)"""
+    
+    def __init__(self, process_variance=1e-5, measurement_variance=1e-1):
+        self.process_variance = process_variance
+        self.measurement_variance = measurement_variance
+        self.estimate = math.nan
+        self.error_estimate = 1.0
+    
+    def update(self, measurement):
+        estimate, error_estimate = _kalman_step_jit(
+            self.estimate, self.error_estimate, measurement,
+            self.process_variance, self.measurement_variance
+        )
+        self.estimate = estimate
+        self.error_estimate = error_estimate
+        return estimate
+    
+    def reset(self):
+        self.estimate = math.nan
+        self.error_estimate = 1.0
@@ -0,0 +1,79 @@
+"""
+Compiled per-sample steps for the scalar smoothing filters
+Uses the ahead-of-time compiled extension when it has been built,
+otherwise Numba JIT (or plain Python when Numba is not installed)
+"""
+
+import math
+
+from core._jit import njit, HAS_NUMBA
+
+_TWO_PI = 2.0 * math.pi
+
+# fastmath without 'nnan': unset filter state is NaN and must not be optimized away
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc', 'ninf'}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _one_euro_step_jit(x, t, x_prev, dx_prev, t_prev, min_cutoff, beta, d_cutoff):
+    """
+    Single One Euro update
+    A NaN x_prev marks an unset filter; the sample is passed through
+    
+    Returns:
+        Tuple of (smoothed value, smoothed derivative)
+    """
+    if x_prev != x_prev:
+        return float(x), 0.0
+    
+    dt = t - t_prev
+    if dt <= 0.0:
+        dt = 0.001  # Prevent division by zero
+    
+    # Smooth the derivative with the fixed derivative cutoff
+    dx = (x - x_prev) / dt
+    r = _TWO_PI * d_cutoff * dt
+    alpha_d = r / (r + 1.0)
+    dx_smoothed = alpha_d * dx + (1.0 - alpha_d) * dx_prev
+    
+    # Smooth the value with a speed-dependent cutoff
+    cutoff = min_cutoff + beta * abs(dx_smoothed)
+    r = _TWO_PI * cutoff * dt
+    alpha = r / (r + 1.0)
+    x_smoothed = alpha * x + (1.0 - alpha) * x_prev
+    
+    return x_smoothed, dx_smoothed
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _kalman_step_jit(estimate, error_estimate, measurement, process_variance, measurement_variance):
+    """
+    Single 1D Kalman predict/update
+    A NaN estimate marks an unset filter; the measurement is taken as-is
+    
+    Returns:
+        Tuple of (new estimate, new error estimate)
+    """
+    if estimate != estimate:
+        return float(measurement), error_estimate
+    
+    error_prediction = error_estimate + process_variance
+    kalman_gain = error_prediction / (error_prediction + measurement_variance)
+    return (estimate + kalman_gain * (measurement - estimate),
+            (1.0 - kalman_gain) * error_prediction)
+
+
+try:
+    # Built by utils._smoothing_kernels_aot; no compilation at startup
+    from ._smoothing_kernels_compiled import one_euro_step, kalman_step
+    HAS_AOT = True
+except ImportError:
+    HAS_AOT = False
+    one_euro_step = _one_euro_step_jit
+    kalman_step = _kalman_step_jit
+
+if HAS_NUMBA and not HAS_AOT:
+    # Compile on import so the first filtered frame doesn't stall
+    one_euro_step(0.0, 1.0 / 30.0, 0.0, 0.0, 0.0, 1.0, 0.007, 1.0)
+    one_euro_step(0.0, 0.0, math.nan, 0.0, math.nan, 1.0, 0.007, 1.0)
+    kalman_step(0.0, 1.0, 0.0, 1e-5, 1e-1)
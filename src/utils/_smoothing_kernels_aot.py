@@ -0,0 +1,32 @@
+"""
+Ahead-of-time build of the smoothing filter kernels
+Run from the src directory with Numba installed:
+
+    python -m utils._smoothing_kernels_aot
+
+This writes utils/_smoothing_kernels_compiled.<ext>, which utils._smoothing_kernels
+imports in place of the JIT versions.
+"""
+
+import os
+from numba.pycc import CC
+
+from ._smoothing_kernels import _one_euro_step_jit, _kalman_step_jit
+
+cc = CC('_smoothing_kernels_compiled')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('one_euro_step', 'UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8, f8, f8)')
+def one_euro_step(x, t, x_prev, dx_prev, t_prev, min_cutoff, beta, d_cutoff):
+    return _one_euro_step_jit(x, t, x_prev, dx_prev, t_prev, min_cutoff, beta, d_cutoff)
+
+
+@cc.export('kalman_step', 'UniTuple(f8, 2)(f8, f8, f8, f8, f8)')
+def kalman_step(estimate, error_estimate, measurement, process_variance, measurement_variance):
+    return _kalman_step_jit(estimate, error_estimate, measurement,
+                            process_variance, measurement_variance)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -8,7 +8,6 @@ import os
 from typing import Any, Dict
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +47,9 @@ class ConfigManager:
         }
     }
     
+    # Serialized once; json.loads gives each instance an independent deep copy
+    _DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+    
     def __init__(self, config_path: str = "config.json"):
         """
         Initialize configuration manager
@@ -56,7 +58,9 @@ class ConfigManager:
             config_path: Path to configuration file
         """
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = json.loads(self._DEFAULT_CONFIG_JSON)
+        # Flat "section.key" -> value view of the config for single-lookup reads
+        self._flat: Dict[str, Any] = {}
         self.load()
     
     def load(self):
@@ -72,13 +76,18 @@ class ConfigManager:
                 logger.error(f"Error loading config: {e}. Using defaults.")
         else:
             logger.info("No config file found. Using default configuration.")
+        self._rebuild_flat()
     
     def save(self):
         """Save configuration to file"""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-            logger.info(f"Configuration saved to {self.config_path}")
+            # Encode in one call, write once, then atomically replace the old file
+            data = json.dumps(self.config, indent=4)
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+            logger.debug("Configuration saved to %s", self.config_path)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
     
@@ -107,7 +116,26 @@ class ConfigManager:
         """
         if section not in self.config:
             self.config[section] = {}
+        old_value = self.config[section].get(key)
         self.config[section][key] = value
+        if isinstance(value, dict) or isinstance(old_value, dict):
+            # Nested values are cached under their own keys, so add or drop them all
+            self._rebuild_flat()
+        else:
+            self._flat[f"{section}.{key}"] = value
+    
+    def fast_get(self, dotted_key: str, default: Any = None) -> Any:
+        """
+        Get configuration value with a single lookup
+        
+        Args:
+            dotted_key: Key in "section.key" form (e.g. "mouse.sensitivity")
+            default: Default value if key not found
+            
+        Returns:
+            Configuration value
+        """
+        return self._flat.get(dotted_key, default)
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -123,9 +151,23 @@ class ConfigManager:
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = json.loads(self._DEFAULT_CONFIG_JSON)
+        self._rebuild_flat()
         logger.info("Configuration reset to defaults")
     
+    def _rebuild_flat(self):
+        """Rebuild the flat "section.key" cache from the nested config"""
+        self._flat = {}
+        
+        def walk(node: dict, prefix: str):
+            for key, value in node.items():
+                if isinstance(value, dict):
+                    walk(value, f"{prefix}{key}.")
+                else:
+                    self._flat[f"{prefix}{key}"] = value
+        
+        walk(self.config, "")
+    
     def _deep_merge(self, base: dict, update: dict):
         """
         Deep merge two dictionaries
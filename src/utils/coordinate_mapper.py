@@ -3,8 +3,11 @@ Coordinate mapping utilities
 Maps between different coordinate systems (camera, screen, normalized)
 """
 
+import math
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple
+
+from ._mapper_kernels import map_points, HAS_KERNEL
 
 
 class CoordinateMapper:
@@ -34,6 +37,61 @@ class CoordinateMapper:
         self.offset_y = 0.0
         self.scale_x = 1.0
         self.scale_y = 1.0
+        
+        self._update_constants()
+    
+    def _update_constants(self):
+        """Precompute the fused calibration/screen mapping and the batch arrays"""
+        # Calibration and screen scale fused into screen = a * normalized + b
+        self._ax = self.scale_x * self.screen_width
+        self._bx = -self.offset_x * self._ax
+        self._ay = self.scale_y * self.screen_height
+        self._by = -self.offset_y * self._ay
+        self._sx_max = self.screen_width - 1
+        self._sy_max = self.screen_height - 1
+        
+        self._inv_cam = np.array([
+            1.0 / self.camera_width if self.camera_width > 0 else 0.0,
+            1.0 / self.camera_height if self.camera_height > 0 else 0.0
+        ], dtype=np.float32)
+        self._a = np.array([self._ax, self._ay])
+        self._b = np.array([self._bx, self._by])
+        self._screen_max = np.array([self._sx_max, self._sy_max], dtype=np.float64)
+        
+        self._specialize_camera_to_screen()
+    
+    def _specialize_camera_to_screen(self):
+        """
+        Replace camera_to_screen on this instance with a version compiled for the
+        current sizes and calibration, with every constant inlined
+        """
+        constants = (self._ax, self._bx, self._ay, self._by)
+        if not all(math.isfinite(c) for c in constants):
+            # Not representable as literals; use the generic method
+            self.__dict__.pop('camera_to_screen', None)
+            return
+        
+        norm_x = f"x / {float(self.camera_width)!r}" if self.camera_width > 0 else "0.0"
+        norm_y = f"y / {float(self.camera_height)!r}" if self.camera_height > 0 else "0.0"
+        source = (
+            "def camera_to_screen(x, y):\n"
+            f"    x = {norm_x}\n"
+            f"    y = {norm_y}\n"
+            "    if x < 0.0: x = 0.0\n"
+            "    elif x > 1.0: x = 1.0\n"
+            "    if y < 0.0: y = 0.0\n"
+            "    elif y > 1.0: y = 1.0\n"
+            f"    sx = int(x * {self._ax!r} + {self._bx!r})\n"
+            f"    sy = int(y * {self._ay!r} + {self._by!r})\n"
+            "    if sx < 0: sx = 0\n"
+            f"    elif sx > {self._sx_max}: sx = {self._sx_max}\n"
+            "    if sy < 0: sy = 0\n"
+            f"    elif sy > {self._sy_max}: sy = {self._sy_max}\n"
+            "    return sx, sy\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        self.camera_to_screen = namespace['camera_to_screen']
     
     def normalize_camera_coords(self, x: float, y: float) -> Tuple[float, float]:
         """
@@ -66,21 +124,9 @@ class CoordinateMapper:
         Returns:
             Tuple of (screen_x, screen_y) in pixels
         """
-        # Apply calibration
-        x_adjusted = (x - self.offset_x) * self.scale_x
-        y_adjusted = (y - self.offset_y) * self.scale_y
-        
-        # Clamp to valid range
-        x_adjusted = max(0.0, min(1.0, x_adjusted))
-        y_adjusted = max(0.0, min(1.0, y_adjusted))
-        
-        # Map to screen
-        screen_x = int(x_adjusted * self.screen_width)
-        screen_y = int(y_adjusted * self.screen_height)
-        
-        # Ensure within bounds
-        screen_x = max(0, min(self.screen_width - 1, screen_x))
-        screen_y = max(0, min(self.screen_height - 1, screen_y))
+        # Apply calibration and map to screen, then clamp within bounds
+        screen_x = max(0, min(self._sx_max, int(self._ax * x + self._bx)))
+        screen_y = max(0, min(self._sy_max, int(self._ay * y + self._by)))
         
         return screen_x, screen_y
     
@@ -88,6 +134,8 @@ class CoordinateMapper:
         """
         Convert camera coordinates directly to screen coordinates
         
+        Generic version; instances use a specialized copy (see _specialize_camera_to_screen).
+        
         Args:
             x: X coordinate in camera space
             y: Y coordinate in camera space
@@ -98,6 +146,33 @@ class CoordinateMapper:
         norm_x, norm_y = self.normalize_camera_coords(x, y)
         return self.normalized_to_screen(norm_x, norm_y)
     
+    def camera_to_screen_batch(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Convert many camera coordinates to screen coordinates at once
+        
+        Args:
+            pts: (N, 2) array of (x, y) coordinates in camera space
+            
+        Returns:
+            (N, 2) int32 array of screen coordinates in pixels
+        """
+        if HAS_KERNEL:
+            pts = np.ascontiguousarray(pts, dtype=np.float32)
+            screen = np.empty(pts.shape, dtype=np.int32)
+            map_points(pts, float(self._inv_cam[0]), float(self._inv_cam[1]),
+                       self._ax, self._bx, self._ay, self._by,
+                       float(self._sx_max), float(self._sy_max), screen)
+            return screen
+        
+        # Normalize and clamp (normalize_camera_coords)
+        norm = np.asarray(pts, dtype=np.float32) * self._inv_cam
+        np.clip(norm, 0.0, 1.0, out=norm)
+        
+        # Apply calibration and map to screen, then clamp (normalized_to_screen)
+        screen = norm * self._a + self._b
+        np.clip(screen, 0.0, self._screen_max, out=screen)
+        return screen.astype(np.int32)
+    
     def set_calibration(self,
                        offset_x: float = 0.0,
                        offset_y: float = 0.0,
@@ -116,6 +191,7 @@ class CoordinateMapper:
         self.offset_y = offset_y
         self.scale_x = scale_x
         self.scale_y = scale_y
+        self._update_constants()
     
     def reset_calibration(self):
         """Reset calibration to defaults"""
@@ -123,6 +199,7 @@ class CoordinateMapper:
         self.offset_y = 0.0
         self.scale_x = 1.0
         self.scale_y = 1.0
+        self._update_constants()
     
     def update_screen_size(self, width: int, height: int):
         """
@@ -134,6 +211,7 @@ class CoordinateMapper:
         """
         self.screen_width = width
         self.screen_height = height
+        self._update_constants()
     
     def update_camera_size(self, width: int, height: int):
         """
@@ -145,3 +223,4 @@ class CoordinateMapper:
         """
         self.camera_width = width
         self.camera_height = height
+        self._update_constants()
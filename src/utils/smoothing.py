@@ -3,74 +3,261 @@ Smoothing and filtering utilities
 Various filters for reducing noise in tracking data
 """
 
-import numpy as np
-from typing import Optional, Tuple
+import math
+from array import array
+from typing import Optional, Tuple, Union
 from collections import deque
+import numpy as np
+
+from core._jit import HAS_NUMBA
+from ._smoothing_kernels import one_euro_step, kalman_step
+
+_TWO_PI = 2.0 * math.pi
+
+# Relative distance from the steady-state error at which a Kalman filter switches
+# to its fixed gain
+_STEADY_TOLERANCE = 1e-6
+
+
+def _nan_to_none(value):
+    """Map the NaN "unset" marker of scalar filter state to None"""
+    return None if value != value else value
 
 
 class ExponentialMovingAverage:
     """Exponential Moving Average filter"""
     
-    def __init__(self, alpha: float = 0.3):
+    __slots__ = ('alpha', 'axes', 'value', '_state', '_scratch')
+    _dtype = 'float64'
+    
+    def __init__(self, alpha: float = 0.3, axes: Optional[Union[int, Tuple[int, ...]]] = None):
         """
         Initialize EMA filter
         
         Args:
             alpha: Smoothing factor (0-1). Lower = more smoothing
+            axes: Number (or shape) of values filtered together. When set, update()
+                  takes and returns arrays of this shape instead of single floats
         """
-        self.alpha = max(0.0, min(1.0, alpha))
+        self.alpha = 0.0 if alpha < 0.0 else (1.0 if alpha > 1.0 else alpha)
+        self.axes = axes
         self.value: Optional[float] = None
+        
+        if axes is not None:
+            self._state = np.zeros(axes, dtype=self._dtype)
+            self._scratch = np.empty_like(self._state)
     
     def update(self, new_value: float) -> float:
         """
         Update filter with new value
         
         Args:
-            new_value: New input value
+            new_value: New input value (array of length axes in vector mode)
             
         Returns:
-            Filtered value
+            Filtered value. In vector mode this is the filter's state array,
+            which is overwritten by the next update
         """
+        if self.axes is not None:
+            return self._update_array(new_value)
+        
         if self.value is None:
             self.value = new_value
         else:
             self.value = self.alpha * new_value + (1 - self.alpha) * self.value
         return self.value
     
+    def _update_array(self, new_value: np.ndarray) -> np.ndarray:
+        """Update all axes at once, in place"""
+        if self.value is None:
+            self._state[...] = new_value
+            self.value = self._state
+        else:
+            # value += alpha * (new - value)
+            np.subtract(new_value, self._state, out=self._scratch)
+            self._scratch *= self.alpha
+            self._state += self._scratch
+        return self._state
+    
     def reset(self):
         """Reset filter"""
         self.value = None
 
 
 class MovingAverageFilter:
-    """Simple moving average filter"""
+    """
+    Simple moving average filter
+    Keeps a circular buffer and updates the mean incrementally, so each update
+    is O(1) regardless of window size
+    """
     
-    def __init__(self, window_size: int = 5):
+    __slots__ = ('window_size', 'axes', '_buf', '_mean', '_scratch', '_idx', '_count',
+                 '_since_refresh')
+    _dtype = 'float64'
+    
+    # Recompute the mean from the buffer this often to drop accumulated rounding error
+    REFRESH_INTERVAL = 10_000
+    
+    def __init__(self, window_size: int = 5, axes: Optional[int] = None):
         """
         Initialize moving average filter
         
         Args:
             window_size: Number of samples to average
+            axes: Number of values filtered together. When set, update() takes
+                  and returns arrays of this length instead of single floats
         """
-        self.window_size = max(1, window_size)
-        self.values = deque(maxlen=window_size)
+        self.window_size = window_size if window_size > 1 else 1
+        self.axes = axes
+        
+        if axes is not None:
+            # One row per sample in the window, written round-robin
+            self._buf = np.zeros((self.window_size, axes), dtype=self._dtype)
+            self._mean = np.zeros(axes, dtype=self._dtype)
+            self._scratch = np.zeros(axes, dtype=self._dtype)
+        else:
+            # Contiguous doubles rather than a list of float objects, without
+            # NumPy's per-element scalar overhead
+            self._buf = array('d', [0.0]) * self.window_size
+            self._mean = 0.0
+        self._idx = 0
+        self._count = 0
+        self._since_refresh = 0
     
     def update(self, new_value: float) -> float:
         """
         Update filter with new value
         
+        Args:
+            new_value: New input value (array of length axes in vector mode)
+            
+        Returns:
+            Filtered value (average of window). In vector mode this is the
+            filter's state array, which is overwritten by the next update
+        """
+        idx = self._idx
+        filling = self._count < self.window_size
+        if filling:
+            self._count += 1
+        
+        # While filling: mean += (new - mean) / n; once full: mean += (new - oldest) / n
+        if self.axes is not None:
+            row = self._buf[idx]
+            np.subtract(new_value, self._mean if filling else row, out=self._scratch)
+            row[...] = new_value
+            self._scratch *= 1.0 / self._count
+            self._mean += self._scratch
+        else:
+            if filling:
+                self._mean += (new_value - self._mean) / self._count
+            else:
+                self._mean += (new_value - self._buf[idx]) / self._count
+            self._buf[idx] = new_value
+        
+        idx += 1
+        self._idx = idx if idx < self.window_size else 0
+        
+        self._since_refresh += 1
+        if self._since_refresh >= self.REFRESH_INTERVAL:
+            self._refresh_mean()
+        
+        return self._mean
+    
+    @property
+    def values(self) -> list:
+        """Samples currently in the window, oldest first (a read-only snapshot)"""
+        buf = self._buf
+        idx = self._idx
+        if self._count < self.window_size:
+            ordered = buf[:self._count]
+        elif self.axes is not None:
+            ordered = np.concatenate((buf[idx:], buf[:idx]))
+        else:
+            ordered = buf[idx:] + buf[:idx]
+        return list(ordered.copy()) if self.axes is not None else ordered.tolist()
+    
+    def _refresh_mean(self):
+        """Recompute the mean from the buffered samples (unused slots are zero)"""
+        if self.axes is not None:
+            np.sum(self._buf, axis=0, out=self._mean)
+            self._mean *= 1.0 / self._count
+        else:
+            self._mean = sum(self._buf) / self._count
+        self._since_refresh = 0
+    
+    def reset(self):
+        """Reset filter"""
+        if self.axes is not None:
+            self._buf.fill(0.0)
+            self._mean.fill(0.0)
+        else:
+            self._buf = array('d', [0.0]) * self.window_size
+            self._mean = 0.0
+        self._idx = 0
+        self._count = 0
+        self._since_refresh = 0
+
+
+class RollingMinMaxFilter:
+    """
+    Rolling minimum and maximum over a fixed window
+    Uses monotonic deques: each sample is pushed and popped at most once,
+    so updates are amortized O(1) regardless of window size
+    """
+    
+    __slots__ = ('window_size', '_min_q', '_max_q', '_index')
+    
+    def __init__(self, window_size: int = 5):
+        """
+        Initialize rolling min/max filter
+        
+        Args:
+            window_size: Number of samples in the window
+        """
+        self.window_size = window_size if window_size > 1 else 1
+        
+        # (index, value) pairs; values increase along _min_q and decrease along _max_q
+        self._min_q = deque()
+        self._max_q = deque()
+        self._index = 0
+    
+    def update(self, new_value: float) -> Tuple[float, float]:
+        """
+        Update filter with new value
+        
         Args:
             new_value: New input value
             
         Returns:
-            Filtered value (average of window)
+            Tuple of (minimum, maximum) over the window
         """
-        self.values.append(new_value)
-        return sum(self.values) / len(self.values)
+        i = self._index
+        self._index = i + 1
+        
+        min_q = self._min_q
+        while min_q and min_q[-1][1] >= new_value:
+            min_q.pop()
+        min_q.append((i, new_value))
+        
+        max_q = self._max_q
+        while max_q and max_q[-1][1] <= new_value:
+            max_q.pop()
+        max_q.append((i, new_value))
+        
+        # Drop samples that have left the window
+        oldest = i - self.window_size
+        if min_q[0][0] <= oldest:
+            min_q.popleft()
+        if max_q[0][0] <= oldest:
+            max_q.popleft()
+        
+        return min_q[0][1], max_q[0][1]
     
     def reset(self):
         """Reset filter"""
-        self.values.clear()
+        self._min_q.clear()
+        self._max_q.clear()
+        self._index = 0
 
 
 class OneEuroFilter:
@@ -80,10 +267,15 @@ class OneEuroFilter:
     Reference: http://cristal.univ-lille.fr/~casiez/1euro/
     """
     
+    __slots__ = ('min_cutoff', 'beta', 'd_cutoff', 'axes', '_x_prev', 'dx_prev', '_t_prev',
+                 '_dt_cache', '_x_state', '_dx', '_alpha')
+    _dtype = 'float64'
+    
     def __init__(self,
                  min_cutoff: float = 1.0,
                  beta: float = 0.007,
-                 d_cutoff: float = 1.0):
+                 d_cutoff: float = 1.0,
+                 axes: Optional[Union[int, Tuple[int, ...]]] = None):
         """
         Initialize One Euro Filter
         
@@ -91,118 +283,501 @@ class OneEuroFilter:
             min_cutoff: Minimum cutoff frequency
             beta: Speed coefficient
             d_cutoff: Cutoff frequency for derivative
+            axes: Number (or shape) of values filtered together. When set, update()
+                  takes and returns arrays of this shape instead of single floats
         """
         self.min_cutoff = min_cutoff
         self.beta = beta
         self.d_cutoff = d_cutoff
+        self.axes = axes
         
-        self.x_prev: Optional[float] = None
+        # NaN until the first sample, which the step kernel passes through (None in
+        # vector mode); the public x_prev/t_prev are None until then in both modes
+        self._x_prev = math.nan if axes is None else None
         self.dx_prev: float = 0.0
-        self.t_prev: Optional[float] = None
+        self._t_prev = math.nan
+        
+        # ((dt, min_cutoff, beta, d_cutoff), (alpha_d, r_min, r_slope)) for the last
+        # frame interval; frames often arrive at a constant interval. The NaN dt
+        # forces the first computation.
+        self._dt_cache = ((math.nan, math.nan, math.nan, math.nan), (0.0, 0.0, 0.0))
+        
+        if axes is not None:
+            self._x_state = np.zeros(axes, dtype=self._dtype)
+            self.dx_prev = np.zeros(axes, dtype=self._dtype)
+            self._dx = np.empty_like(self._x_state)
+            self._alpha = np.empty_like(self._x_state)
     
     def update(self, x: float, t: float) -> float:
         """
         Update filter with new value
         
         Args:
-            x: New input value
-            t: Timestamp (seconds)
+            x: New input value (array of length axes in vector mode)
+            t: Timestamp (seconds), shared by all axes
             
         Returns:
-            Filtered value
+            Filtered value. In vector mode this is the filter's state array,
+            which is overwritten by the next update
         """
-        if self.x_prev is None:
-            self.x_prev = x
-            self.t_prev = t
-            return x
+        if self.axes is not None:
+            return self._update_array(x, t)
+        
+        x_smoothed, dx_smoothed = one_euro_step(x, t, self._x_prev, self.dx_prev, self._t_prev,
+                                                self.min_cutoff, self.beta, self.d_cutoff)
+        
+        # Update state
+        self._x_prev = x_smoothed
+        self.dx_prev = dx_smoothed
+        self._t_prev = t
         
-        # Calculate time delta
-        dt = t - self.t_prev
+        return x_smoothed
+    
+    def _update_array(self, x: np.ndarray, t: float) -> np.ndarray:
+        """Update all axes at once, in place"""
+        if self._x_prev is None:
+            self._x_state[...] = x
+            self._x_prev = self._x_state
+            self._t_prev = t
+            return self._x_state
+        
+        dt = t - self._t_prev
         if dt <= 0:
             dt = 0.001  # Prevent division by zero
         
-        # Calculate derivative
-        dx = (x - self.x_prev) / dt
+        dx = self._dx
+        alpha = self._alpha
+        alpha_d, r_min, r_slope = self._dt_coefficients(dt)
         
-        # Smooth derivative
-        alpha_d = self._smoothing_factor(dt, self.d_cutoff)
-        dx_smoothed = self._exponential_smoothing(alpha_d, dx, self.dx_prev)
+        # Smoothed derivative: dx_prev += alpha_d * ((x - x_prev) / dt - dx_prev)
+        np.subtract(x, self._x_state, out=dx)
+        dx *= 1.0 / dt
+        dx -= self.dx_prev
+        dx *= alpha_d
+        self.dx_prev += dx
         
-        # Calculate cutoff frequency
-        cutoff = self.min_cutoff + self.beta * abs(dx_smoothed)
+        # alpha = r / (r + 1) with r = 2*pi*dt * (min_cutoff + beta*|dx|) = r_min + r_slope*|dx|
+        np.abs(self.dx_prev, out=alpha)
+        alpha *= r_slope
+        alpha += r_min
+        np.add(alpha, 1.0, out=dx)
+        np.divide(alpha, dx, out=alpha)
         
-        # Smooth value
-        alpha = self._smoothing_factor(dt, cutoff)
-        x_smoothed = self._exponential_smoothing(alpha, x, self.x_prev)
+        # x_prev += alpha * (x - x_prev)
+        np.subtract(x, self._x_state, out=dx)
+        dx *= alpha
+        self._x_state += dx
         
-        # Update state
-        self.x_prev = x_smoothed
-        self.dx_prev = dx_smoothed
-        self.t_prev = t
-        
-        return x_smoothed
+        self._t_prev = t
+        return self._x_state
     
     def _smoothing_factor(self, dt: float, cutoff: float) -> float:
         """Calculate smoothing factor"""
-        r = 2 * np.pi * cutoff * dt
+        r = _TWO_PI * cutoff * dt
         return r / (r + 1)
     
-    def _exponential_smoothing(self, alpha: float, x: float, x_prev: float) -> float:
-        """Apply exponential smoothing"""
-        return alpha * x + (1 - alpha) * x_prev
+    def _dt_coefficients(self, dt: float) -> Tuple[float, float, float]:
+        """
+        Constants of the update for a frame interval, recomputed only when dt
+        or a filter parameter changes
+        
+        Returns:
+            Tuple of (derivative smoothing factor, r at zero speed, r per unit speed)
+        """
+        key = (dt, self.min_cutoff, self.beta, self.d_cutoff)
+        cached_key, coefficients = self._dt_cache
+        if key != cached_key:
+            coefficients = (self._smoothing_factor(dt, self.d_cutoff),
+                            _TWO_PI * dt * self.min_cutoff,
+                            _TWO_PI * dt * self.beta)
+            self._dt_cache = (key, coefficients)
+        return coefficients
+    
+    @property
+    def x_prev(self) -> Optional[float]:
+        """Previous filtered value, or None before the first sample"""
+        if self.axes is None:
+            return _nan_to_none(self._x_prev)
+        return self._x_prev
+    
+    @x_prev.setter
+    def x_prev(self, value: Optional[float]):
+        if value is None:
+            self._x_prev = math.nan if self.axes is None else None
+        else:
+            self._x_prev = value
+    
+    @property
+    def t_prev(self) -> Optional[float]:
+        """Timestamp of the previous sample, or None before the first sample"""
+        return _nan_to_none(self._t_prev)
+    
+    @t_prev.setter
+    def t_prev(self, value: Optional[float]):
+        self._t_prev = math.nan if value is None else value
     
     def reset(self):
         """Reset filter"""
-        self.x_prev = None
-        self.dx_prev = 0.0
-        self.t_prev = None
+        self._t_prev = math.nan
+        if self.axes is not None:
+            self._x_prev = None
+            self.dx_prev.fill(0.0)
+        else:
+            self._x_prev = math.nan
+            self.dx_prev = 0.0
 
 
 class KalmanFilter:
     """Simple 1D Kalman filter for position tracking"""
     
+    __slots__ = ('process_variance', 'measurement_variance', 'axes', '_estimate',
+                 'error_estimate', '_steady', '_steady_gain', '_steady_error',
+                 '_state', '_scratch')
+    _dtype = 'float64'
+    
     def __init__(self,
                  process_variance: float = 1e-5,
-                 measurement_variance: float = 1e-1):
+                 measurement_variance: float = 1e-1,
+                 axes: Optional[Union[int, Tuple[int, ...]]] = None):
         """
         Initialize Kalman filter
         
         Args:
             process_variance: Process noise variance
             measurement_variance: Measurement noise variance
+            axes: Number (or shape) of values filtered together. When set, update()
+                  takes and returns arrays of this shape instead of single floats
         """
         self.process_variance = process_variance
         self.measurement_variance = measurement_variance
+        self.axes = axes
         
-        self.estimate: Optional[float] = None
+        # NaN until the first measurement, which the step kernel takes as-is (None in
+        # vector mode); the public estimate is None until then in both modes
+        self._estimate = math.nan if axes is None else None
         self.error_estimate: float = 1.0
+        
+        # With constant variances the error estimate converges to a fixed point
+        # (closed-form 1D Riccati solution), after which the gain is constant
+        error_prediction = (process_variance
+                            + math.sqrt(process_variance ** 2
+                                        + 4.0 * process_variance * measurement_variance)) / 2.0
+        denominator = error_prediction + measurement_variance
+        self._steady_gain = error_prediction / denominator if denominator > 0 else 1.0
+        self._steady_error = (1.0 - self._steady_gain) * error_prediction
+        self._steady = False
+        
+        if axes is not None:
+            self._state = np.zeros(axes, dtype=self._dtype)
+            self._scratch = np.empty_like(self._state)
     
     def update(self, measurement: float) -> float:
         """
         Update filter with new measurement
         
         Args:
-            measurement: New measured value
+            measurement: New measured value (array of length axes in vector mode)
             
         Returns:
-            Filtered estimate
+            Filtered estimate. In vector mode this is the filter's state array,
+            which is overwritten by the next update
         """
-        if self.estimate is None:
-            self.estimate = measurement
-            return measurement
+        if self.axes is not None:
+            return self._update_array(measurement)
         
-        # Prediction
-        prediction = self.estimate
-        error_prediction = self.error_estimate + self.process_variance
+        if self._steady:
+            self._estimate += self._steady_gain * (measurement - self._estimate)
+            return self._estimate
         
-        # Update
-        kalman_gain = error_prediction / (error_prediction + self.measurement_variance)
-        self.estimate = prediction + kalman_gain * (measurement - prediction)
-        self.error_estimate = (1 - kalman_gain) * error_prediction
+        self._estimate, self.error_estimate = kalman_step(
+            self._estimate, self.error_estimate, measurement,
+            self.process_variance, self.measurement_variance
+        )
+        self._check_steady()
         
-        return self.estimate
+        return self._estimate
+    
+    def _update_array(self, measurement: np.ndarray) -> np.ndarray:
+        """Update all axes at once, in place"""
+        if self._estimate is None:
+            self._state[...] = measurement
+            self._estimate = self._state
+            return self._state
+        
+        # The error covariance doesn't depend on the measurement, so every
+        # axis shares the same scalar gain
+        if self._steady:
+            kalman_gain = self._steady_gain
+        else:
+            error_prediction = self.error_estimate + self.process_variance
+            kalman_gain = error_prediction / (error_prediction + self.measurement_variance)
+            self.error_estimate = (1 - kalman_gain) * error_prediction
+            self._check_steady()
+        
+        np.subtract(measurement, self._state, out=self._scratch)
+        self._scratch *= kalman_gain
+        self._state += self._scratch
+        
+        return self._state
+    
+    def _check_steady(self):
+        """Switch to the fixed steady-state gain once the error estimate has converged"""
+        if abs(self.error_estimate - self._steady_error) <= _STEADY_TOLERANCE * self._steady_error:
+            self.error_estimate = self._steady_error
+            self._steady = True
+    
+    @property
+    def estimate(self) -> Optional[float]:
+        """Current estimate, or None before the first measurement"""
+        if self.axes is None:
+            return _nan_to_none(self._estimate)
+        return self._estimate
+    
+    @estimate.setter
+    def estimate(self, value: Optional[float]):
+        if value is None:
+            self._estimate = math.nan if self.axes is None else None
+        else:
+            self._estimate = value
     
     def reset(self):
         """Reset filter"""
-        self.estimate = None
+        self._estimate = math.nan if self.axes is None else None
         self.error_estimate = 1.0
+        self._steady = False
+
+
+class VectorEMA(ExponentialMovingAverage):
+    """
+    EMA over a whole array (e.g. every hand landmark) in one update
+    State is kept in contiguous float32 arrays updated in place
+    """
+    
+    __slots__ = ()
+    _dtype = 'float32'
+    
+    def __init__(self, shape: Tuple[int, ...], alpha: float = 0.3):
+        """
+        Initialize vector EMA filter
+        
+        Args:
+            shape: Shape of the arrays passed to update(), e.g. (21, 3) for landmarks
+            alpha: Smoothing factor (0-1). Lower = more smoothing
+        """
+        super().__init__(alpha, axes=shape)
+
+
+class VectorOneEuro(OneEuroFilter):
+    """
+    One Euro filter over a whole array (e.g. every hand landmark) in one update
+    State is kept in contiguous float32 arrays updated in place
+    """
+    
+    __slots__ = ()
+    _dtype = 'float32'
+    
+    def __init__(self,
+                 shape: Tuple[int, ...],
+                 min_cutoff: float = 1.0,
+                 beta: float = 0.007,
+                 d_cutoff: float = 1.0):
+        """
+        Initialize vector One Euro filter
+        
+        Args:
+            shape: Shape of the arrays passed to update(), e.g. (21, 3) for landmarks
+            min_cutoff: Minimum cutoff frequency
+            beta: Speed coefficient
+            d_cutoff: Cutoff frequency for derivative
+        """
+        super().__init__(min_cutoff, beta, d_cutoff, axes=shape)
+
+
+class OneEuroFilterBank(VectorOneEuro):
+    """
+    Bank of n independent One Euro filters stored as flat float32 arrays
+    Replaces one OneEuroFilter per coordinate; lanes can still be restarted
+    individually, as separate filter instances could
+    """
+    
+    __slots__ = ('_restart_mask', '_restart_pending')
+    
+    def __init__(self,
+                 n: int,
+                 min_cutoff: float = 1.0,
+                 beta: float = 0.007,
+                 d_cutoff: float = 1.0):
+        """
+        Initialize filter bank
+        
+        Args:
+            n: Number of filtered values (e.g. 2 hands * 21 landmarks * 3 = 126)
+            min_cutoff: Minimum cutoff frequency
+            beta: Speed coefficient
+            d_cutoff: Cutoff frequency for derivative
+        """
+        super().__init__((n,), min_cutoff, beta, d_cutoff)
+        self._restart_mask = np.zeros(n, dtype=bool)
+        self._restart_pending = False
+    
+    def update(self, x: np.ndarray, t: float) -> np.ndarray:
+        """
+        Update all lanes with new values
+        
+        Args:
+            x: Array of n input values
+            t: Timestamp (seconds)
+            
+        Returns:
+            Filtered values (the bank's state array, overwritten by the next update)
+        """
+        smoothed = super().update(x, t)
+        if self._restart_pending:
+            # Restarted lanes pass their first sample through, like a fresh filter
+            np.copyto(smoothed, x, where=self._restart_mask)
+            np.copyto(self.dx_prev, 0.0, where=self._restart_mask)
+            self._restart_mask.fill(False)
+            self._restart_pending = False
+        return smoothed
+    
+    def reset_lanes(self, lanes):
+        """
+        Restart some of the filters, leaving the others untouched
+        
+        Args:
+            lanes: Lane indices or boolean mask of length n
+        """
+        self._restart_mask[lanes] = True
+        self._restart_pending = True
+    
+    def reset(self):
+        """Reset filter"""
+        super().reset()
+        self._restart_mask.fill(False)
+        self._restart_pending = False
+
+
+class VectorKalman(KalmanFilter):
+    """
+    1D Kalman filter applied to every element of an array in one update
+    State is kept in contiguous float32 arrays updated in place
+    """
+    
+    __slots__ = ()
+    _dtype = 'float32'
+    
+    def __init__(self,
+                 shape: Tuple[int, ...],
+                 process_variance: float = 1e-5,
+                 measurement_variance: float = 1e-1):
+        """
+        Initialize vector Kalman filter
+        
+        Args:
+            shape: Shape of the arrays passed to update(), e.g. (21, 3) for landmarks
+            process_variance: Process noise variance
+            measurement_variance: Measurement noise variance
+        """
+        super().__init__(process_variance, measurement_variance, axes=shape)
+
+
+class KalmanBank(VectorKalman):
+    """
+    Bank of n independent 1D Kalman filters stored as flat float32 arrays
+    All lanes share one gain while their error estimates agree; after
+    reset_lanes() each lane tracks its own error until they converge again
+    """
+    
+    __slots__ = ('_error', '_gain', '_per_lane', '_restart_mask', '_restart_pending')
+    
+    def __init__(self,
+                 n: int,
+                 process_variance: float = 1e-5,
+                 measurement_variance: float = 1e-1):
+        """
+        Initialize filter bank
+        
+        Args:
+            n: Number of filtered values (e.g. 2 hands * 21 landmarks * 3 = 126)
+            process_variance: Process noise variance
+            measurement_variance: Measurement noise variance
+        """
+        super().__init__((n,), process_variance, measurement_variance)
+        self._error = np.ones(n, dtype=self._dtype)
+        self._gain = np.empty(n, dtype=self._dtype)
+        self._per_lane = False
+        self._restart_mask = np.zeros(n, dtype=bool)
+        self._restart_pending = False
+    
+    def _update_array(self, measurement: np.ndarray) -> np.ndarray:
+        """Update all lanes at once, in place"""
+        if not self._per_lane or self._estimate is None:
+            self._per_lane = False
+            self._restart_pending = False
+            self._restart_mask.fill(False)
+            return super()._update_array(measurement)
+        
+        state = self._state
+        error = self._error
+        gain = self._gain
+        scratch = self._scratch
+        
+        # Predict, then per-lane gain K = P / (P + R)
+        error += self.process_variance
+        np.add(error, self.measurement_variance, out=gain)
+        np.divide(error, gain, out=gain)
+        
+        np.subtract(measurement, state, out=scratch)
+        scratch *= gain
+        state += scratch
+        
+        # P = (1 - K) * P
+        np.multiply(gain, error, out=scratch)
+        error -= scratch
+        
+        if self._restart_pending:
+            # Restarted lanes take the measurement as-is, like a fresh filter
+            np.copyto(state, measurement, where=self._restart_mask)
+            np.copyto(error, 1.0, where=self._restart_mask)
+            self._restart_mask.fill(False)
+            self._restart_pending = False
+        else:
+            high = float(error.max())
+            if high - float(error.min()) <= _STEADY_TOLERANCE * high:
+                # Every lane has the same error again; go back to one shared gain
+                self.error_estimate = high
+                self._per_lane = False
+                self._check_steady()
+        
+        return state
+    
+    def reset_lanes(self, lanes):
+        """
+        Restart some of the filters, leaving the others untouched
+        
+        Args:
+            lanes: Lane indices or boolean mask of length n
+        """
+        if not self._per_lane:
+            self._error.fill(self.error_estimate)
+            self._per_lane = True
+            self._steady = False
+        self._restart_mask[lanes] = True
+        self._restart_pending = True
+    
+    def reset(self):
+        """Reset filter"""
+        super().reset()
+        self._per_lane = False
+        self._restart_mask.fill(False)
+        self._restart_pending = False
+
+
+if HAS_NUMBA:
+    # Filter state lives in a Numba struct, so nopython code can call update() directly
+    from ._smoothing_jitclass import (ExponentialMovingAverageJIT, OneEuroFilterJIT,
+                                      KalmanFilterJIT)
+else:
+    ExponentialMovingAverageJIT = ExponentialMovingAverage
+    OneEuroFilterJIT = OneEuroFilter
+    KalmanFilterJIT = KalmanFilter
@@ -1,11 +1,37 @@
 """
 Test script to verify GestureMouse installation
+Pass --deep to import each package instead of only locating it
 """
 
 import sys
+import importlib
+import importlib.util
 
-def test_imports():
-    """Test if all required packages can be imported"""
+def _try_import(package):
+    """Import a package, returning (ok, error message)"""
+    try:
+        importlib.import_module(package)
+        return True, None
+    except ImportError as e:
+        return False, str(e)
+
+def _find_package(package):
+    """Locate a package without running its code, returning (ok, error message)"""
+    try:
+        if importlib.util.find_spec(package) is not None:
+            return True, None
+        return False, "not found"
+    except (ImportError, ValueError) as e:
+        return False, str(e)
+
+def test_imports(deep=False):
+    """
+    Test if all required packages are installed
+    
+    Args:
+        deep: Import each package (checks that its extensions load) rather
+              than only locating it, which skips heavy initialization
+    """
     packages = {
         'cv2': 'OpenCV',
         'mediapipe': 'MediaPipe',
@@ -18,16 +44,23 @@ def test_imports():
     print("=" * 60)
     print("GestureMouse Installation Test")
     print("=" * 60)
-    print("\nTesting package imports...\n")
     
     all_ok = True
     failed_packages = []
     
-    for package, name in packages.items():
-        try:
-            __import__(package)
-            print(f"✓ {name:20s} - OK")
-        except ImportError as e:
+    if deep:
+        print("\nTesting package imports...\n")
+        status = "imports cleanly"
+        results = [_try_import(package) for package in packages]
+    else:
+        print("\nLooking for packages...\n")
+        status = "found"
+        results = [_find_package(package) for package in packages]
+    
+    for name, (ok, _) in zip(packages.values(), results):
+        if ok:
+            print(f"✓ {name:20s} - OK ({status})")
+        else:
             print(f"✗ {name:20s} - FAILED")
             all_ok = False
             failed_packages.append(name)
@@ -53,8 +86,21 @@ def test_camera():
     try:
         import cv2
         print("\nTesting camera access...")
-        cap = cv2.VideoCapture(0)
+        
+        # Name the platform backend so OpenCV doesn't probe every one in turn
+        if sys.platform == 'win32':
+            backend = cv2.CAP_DSHOW
+        elif sys.platform == 'darwin':
+            backend = cv2.CAP_AVFOUNDATION
+        else:
+            backend = cv2.CAP_V4L2
+        cap = cv2.VideoCapture(0, backend)
+        
         if cap.isOpened():
+            # One small frame is enough for a sanity check
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             ret, frame = cap.read()
             cap.release()
             if ret:
@@ -71,7 +117,7 @@ def test_camera():
         return False
 
 if __name__ == "__main__":
-    imports_ok = test_imports()
+    imports_ok = test_imports(deep='--deep' in sys.argv[1:])
     
     if imports_ok:
         camera_ok = test_camera()